@@ -81,17 +81,32 @@ class FinalResult(BaseModel):
     queries: list[list[MultiCandidateQuery]]
     is_query_covered: list[bool]
 
+
+# Text query fields matched by case-insensitive substring
+_TEXT_QUERY_KEYS = ("event_names", "venues", "cities")
+
+
+def _lowered_terms(query: MultiCandidateQuery) -> dict[str, tuple[str, ...]]:
+    """Lowercase a query's text terms once, so matching needn't redo it per info."""
+    return {key: tuple(term.lower() for term in query.get(key) or ()) for key in _TEXT_QUERY_KEYS}
+
+
 class SeatGeekInfoGathering(BaseMetric):
     """Gather event ticket information from seatgeek to evaluate query coverage."""
     def __init__(self, queries: list[list[MultiCandidateQuery]]) -> None:
         super().__init__()
         self.queries = queries
+        self._lowered_queries = [
+            [_lowered_terms(q) for q in alternative_conditions] for alternative_conditions in queries
+        ]
         self._all_infos: list[list[InfoDict]] = []
         self._is_query_covered: list[bool] = [False] * len(queries)
         self._unavailable_evidences: list[list[list[InfoDict]]] = [
             [[] for _ in alternative_conditions] for alternative_conditions in queries
         ]
         self._navigation_stack: list[dict] = [] 
+        # (base_url, page_type) -> position in _navigation_stack
+        self._nav_index: dict[tuple[str, str], int] = {}
         self._tracked_pages: set = set()
 
     def __repr__(self) -> str:
@@ -108,6 +123,7 @@ class SeatGeekInfoGathering(BaseMetric):
         self._is_query_covered = [False] * len(self.queries)
         self._unavailable_evidences = [[[] for _ in alternative_conditions] for alternative_conditions in self.queries]
         self._navigation_stack = []
+        self._nav_index = {}
         self._tracked_pages = set()
     
     def attach_to_context(self, context) -> None:
@@ -183,8 +199,8 @@ class SeatGeekInfoGathering(BaseMetric):
         self._all_infos.append(infos)
         
         base_url = url.split("?")[0]
-        existing_idx = next((i for i, e in enumerate(self._navigation_stack) 
-                           if e["base_url"] == base_url and e["page_type"] == page_type), None)
+        nav_key = (base_url, page_type)
+        existing_idx = self._nav_index.get(nav_key)
         
         page_entry = {
             "url": url,
@@ -196,6 +212,7 @@ class SeatGeekInfoGathering(BaseMetric):
         if existing_idx is not None:
             self._navigation_stack[existing_idx] = page_entry
         else:
+            self._nav_index[nav_key] = len(self._navigation_stack)
             self._navigation_stack.append(page_entry)
 
     async def compute(self) -> FinalResult:
@@ -203,8 +220,11 @@ class SeatGeekInfoGathering(BaseMetric):
         event_listing_found = False
         fallback_infos: list[InfoDict] = []
         
-        # Walk backwards
+        # Walk backwards; coverage persists across compute() calls, so stop
+        # as soon as nothing is left to cover
         for page_visit in reversed(self._navigation_stack):
+            if all(self._is_query_covered):
+                break
             page_type = page_visit["page_type"]
             page_infos = page_visit["infos"]
                 
@@ -223,7 +243,7 @@ class SeatGeekInfoGathering(BaseMetric):
                 fallback_infos.extend(page_infos)
         
         # Fallback for sold-out/discovery
-        if not event_listing_found and fallback_infos:
+        if not event_listing_found and fallback_infos and not all(self._is_query_covered):
             for i, alternative_conditions in enumerate(self.queries):
                 if self._is_query_covered[i]:
                     continue
@@ -257,27 +277,36 @@ class SeatGeekInfoGathering(BaseMetric):
     ) -> bool:
         for j, alternative_condition in enumerate(alternative_conditions):
             evidences = self._unavailable_evidences[i][j]
-            if self._check_multi_candidate_query(alternative_condition, info, evidences):
+            lowered = self._lowered_queries[i][j]
+            if self._check_multi_candidate_query(alternative_condition, info, evidences, lowered):
                 return True
         return False
 
     @classmethod
     def _check_multi_candidate_query(
-        cls, query: MultiCandidateQuery, info: InfoDict, evidences: list[InfoDict]
+        cls,
+        query: MultiCandidateQuery,
+        info: InfoDict,
+        evidences: list[InfoDict],
+        lowered: dict[str, tuple[str, ...]] | None = None,
     ) -> bool:
         
-        # Text based matches
-        if q_names := query.get("event_names"):
-            if not any(q.lower() in info.get("eventName", "").lower() for q in q_names):
+        # Text based matches (info fields lowercased once, not per term)
+        if lowered is None:
+            lowered = _lowered_terms(query)
+        if q_names := lowered["event_names"]:
+            event_name = info.get("eventName", "").lower()
+            if not any(q in event_name for q in q_names):
                 return False
 
-        if q_venues := query.get("venues"):
-            if not any(q.lower() in info.get("venue", "").lower() for q in q_venues):
+        if q_venues := lowered["venues"]:
+            venue = info.get("venue", "").lower()
+            if not any(q in venue for q in q_venues):
                 return False
 
-        if q_cities := query.get("cities"):
+        if q_cities := lowered["cities"]:
             city = (info.get("city") or "").lower()
-            if not city or not any(c.lower() in city for c in q_cities):
+            if not city or not any(c in city for c in q_cities):
                 return False
 
         # Numeric and Filter constraints
@@ -297,11 +326,34 @@ class SeatGeekInfoGathering(BaseMetric):
 
     @classmethod
     def _is_exhausted(cls, query: MultiCandidateQuery, evidences: list[InfoDict]) -> bool:
+        """Whether every (event name, date) choice has unavailable evidence.
+
+        Evidence is indexed once, so each choice is a set lookup; an empty name
+        or date in the query matches any evidence.
+        """
+        if not evidences:
+            return False
+        seen_pairs, seen_names, seen_dates = set(), set(), set()
+        for info in evidences:
+            name = info.get("eventName", "").lower()
+            date = info.get("date")
+            seen_pairs.add((name, date))
+            seen_names.add(name)
+            seen_dates.add(date)
+
         q_names = query.get("event_names") or [None]
         q_dates = query.get("dates") or [None]
 
         for q_name, q_date in itertools.product(q_names, q_dates):
-            if not any(cls._check_single_candidate_query({"event_name": q_name, "date": q_date}, info) for info in evidences):
+            if q_name and q_date:
+                found = (q_name.lower(), q_date) in seen_pairs
+            elif q_name:
+                found = q_name.lower() in seen_names
+            elif q_date:
+                found = q_date in seen_dates
+            else:
+                found = True
+            if not found:
                 return False
         return True
 
@@ -30,9 +30,11 @@ Chrome-Verified Patterns (Feb 2026):
 - ?sort_by=se_score (default sort, query param)
 """
 
+import functools
 import re
+import sys
 from typing import TypedDict
-from urllib.parse import urlparse, unquote, parse_qs
+from urllib.parse import unquote, parse_qs
 
 from beartype import beartype
 from loguru import logger
@@ -91,6 +93,13 @@ IGNORED_QUERY_PARAMS = {
 # in_rect = map bounding box (lat,lat,lon,lon) from zoom/pan
 IGNORED_FILTERS = {"in_rect"}
 
+# One filter token: key, operator (>= or :), value — e.g. beds>=2, price:500000-
+FILTER_TOKEN_RE = re.compile(r"([^|:>]+?)(>=|:)([^|]*)")
+
+# Characters that mark a path segment as a filter segment rather than a
+# location/neighborhood (key:value, key>=value, filter|filter)
+FILTER_MARKERS = frozenset(":>|")
+
 # Chrome-Verified Property Type Codes
 PROPERTY_TYPE_CODES = {
     "D1": "condo",
@@ -205,6 +214,10 @@ FILTER_NAME_ALIASES = {
     # Area (neighborhood ID)
     "area": "area",
 }
+# Also accept the hyphenated spelling of every underscore alias
+FILTER_NAME_ALIASES.update({
+    k.replace("_", "-"): v for k, v in FILTER_NAME_ALIASES.items() if "_" in k
+})
 
 # Amenity name aliases: map variant names to canonical amenity values
 # These use the "amenities:" or "opt_amenities:" prefix in real URLs
@@ -276,10 +289,291 @@ STATUS_ALIASES = {
     "unavailable": "closed",
 }
 
+# Characters dropped from price values in one pass (1,500,000 / $500k)
+PRICE_STRIP_TABLE = str.maketrans("", "", ",$")
+
+# Price abbreviation suffixes (500k, 2m)
+PRICE_ABBREV_MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+
 # Boolean value normalization
 BOOLEAN_TRUE_VALUES = {"1", "true", "yes", "on", "allowed", "new development", "pre-war", "pre_war", "prewar"}
 
 
+# ============================================================================
+# URL PARSING
+# ============================================================================
+
+@functools.lru_cache(maxsize=4096)
+def _parse_streeteasy_url(url: str) -> tuple[str, str, str, tuple[tuple[str, str], ...]]:
+    """
+    Cached, immutable form of ``_parse_url_parts``, shared by all verifier
+    instances. Returns (search_type, location, neighborhood, filter items).
+    """
+    parts = _parse_url_parts(url)
+    return parts["search_type"], parts["location"], parts["neighborhood"], tuple(parts["filters"].items())
+
+
+def _parse_url_parts(url: str) -> dict:
+    """
+    Parse a StreetEasy URL into normalized components.
+
+    Returns dict with keys:
+        search_type: "sale", "rent", or "sold"
+        location: borough name (lowercase)
+        neighborhood: neighborhood name (lowercase) or ""
+        filters: dict of normalized filter key -> value
+    """
+    url = url.strip()
+    url = unquote(url)
+
+    # Only the path is used, so slice it out directly instead of building a
+    # full urlparse() result: drop scheme, query/fragment, then netloc
+    scheme_end = url.find("://")
+    tail = url[scheme_end + 3:] if scheme_end >= 0 else url
+    tail = tail.split("#", 1)[0].split("?", 1)[0]
+    netloc_end = tail.find("/")
+    path = tail[netloc_end:].strip("/") if netloc_end >= 0 else ""
+    path_lower = path.lower()
+
+    result = {
+        "search_type": "",
+        "location": "",
+        "neighborhood": "",
+        "filters": {},
+    }
+
+    # Split path into segments
+    segments = [s for s in path_lower.split("/") if s]
+
+    if not segments:
+        return result
+
+    # Extract search type from first segment
+    if segments[0] in SEARCH_TYPES:
+        result["search_type"] = SEARCH_TYPES[segments[0]]
+        segments = segments[1:]
+    else:
+        result["search_type"] = "sale"
+
+    if not segments:
+        return result
+
+    # Extract location (borough) from next segment
+    location_segment = segments[0]
+    if FILTER_MARKERS.isdisjoint(location_segment):
+        result["location"] = sys.intern(location_segment)
+        segments = segments[1:]
+    else:
+        return result
+
+    if not segments:
+        return result
+
+    # Check for neighborhood segment (before filters)
+    if FILTER_MARKERS.isdisjoint(segments[0]):
+        result["neighborhood"] = sys.intern(segments[0])
+        segments = segments[1:]
+
+    if not segments:
+        return result
+
+    # Remaining segments contain pipe-delimited filters; each slash segment
+    # is its own filter container. One regex pass tokenizes every
+    # key:value / key>=value pair (pieces without an operator are skipped).
+    for match in FILTER_TOKEN_RE.finditer("|".join(segments)):
+        key = match.group(1).strip()
+        if not key:
+            continue
+        value = match.group(3).strip()
+        if match.group(2) == ">=":
+            value += "-"  # Convert to range: beds>=2 → beds:2-
+
+        # Skip map/viewport filters
+        if key.replace("-", "_") in IGNORED_FILTERS:
+            continue
+        canonical_key, canonical_value = _normalize_filter(key, value)
+        # Interned so dict probes and key compares hit the identity fast path
+        canonical_key = sys.intern(canonical_key)
+
+        # Handle multi-value filters (e.g., subway:L|subway:1)
+        if canonical_key in result["filters"]:
+            existing = result["filters"][canonical_key]
+            existing_set = set(existing.split(","))
+            new_set = set(canonical_value.split(","))
+            merged = sorted(existing_set | new_set)
+            result["filters"][canonical_key] = ",".join(merged)
+        else:
+            result["filters"][canonical_key] = canonical_value
+
+    return result
+
+
+# ============================================================================
+# NORMALIZATION
+# ============================================================================
+
+def _normalize_filter(key: str, value: str) -> tuple[str, str]:
+    """
+    Normalize a filter key and value to canonical forms.
+
+    Handles:
+    - amenities:X → key="amenities", value normalized
+    - type:D1,P1 → key="type", value normalized
+    - price normalization (commas, abbreviations)
+    - status aliases
+    - Boolean normalization
+
+    Expects ``key`` and ``value`` already lowercased and stripped, as
+    tokenized by ``FILTER_TOKEN_RE`` from the lowercased URL path.
+    """
+    # Handle "amenities:" and "opt_amenities:" prefixes
+    # StreetEasy uses two prefixes depending on the "Must-have" toggle:
+    #   amenities:X     = Must-have ON (required amenity)
+    #   opt_amenities:X = Must-have OFF (optional/preferred amenity)
+    # Both are normalized to "amenities" key for matching, since task
+    # descriptions say "with parking" not "must-have parking".
+    # Supports single (amenities:doorman) and comma-separated
+    # (amenities:elevator,doorman) values (browser-verified Feb 2026)
+    if key in ("amenities", "opt_amenities"):
+        # Fast path: most URLs carry a single amenity per key
+        if "," not in value:
+            return "amenities", AMENITY_ALIASES.get(value.replace("-", "_"), value)
+        amenities = [a.strip() for a in value.split(",")]
+        normalized = []
+        for a in amenities:
+            canonical = AMENITY_ALIASES.get(a.replace("-", "_"), a)
+            normalized.append(canonical)
+        return "amenities", ",".join(sorted(normalized))
+
+    # Normalize key using aliases (hyphen forms are pre-expanded, so a
+    # single probe covers most keys; mixed forms fall back to underscores)
+    canonical_key = FILTER_NAME_ALIASES.get(key)
+    if canonical_key is None:
+        canonical_key = FILTER_NAME_ALIASES.get(key.replace("-", "_"), key) if "-" in key else key
+
+    # Normalize value with the key's dispatch-table normalizer, if any
+    normalizer = VALUE_NORMALIZERS.get(canonical_key)
+    if normalizer is None:
+        return canonical_key, value
+    return canonical_key, normalizer(value)
+
+
+def _normalize_type_value(value: str) -> str:
+    """
+    Normalize property type value.
+    Handles: D1, P1, D1,P1, or human-readable names.
+    Returns comma-separated sorted codes.
+    """
+    value = value.upper()
+
+    # Fast path: single code or name, nothing to split/sort
+    if "," not in value:
+        if value in PROPERTY_TYPE_CODES:
+            return value
+        return PROPERTY_TYPE_NAMES_TO_CODES.get(value.lower(), value)
+
+    # If already code format (D1, P1, D1,P1)
+    parts = [p.strip() for p in value.split(",")]
+    normalized = []
+    for part in parts:
+        if part in PROPERTY_TYPE_CODES:
+            normalized.append(part)
+        elif part.lower() in PROPERTY_TYPE_NAMES_TO_CODES:
+            normalized.append(PROPERTY_TYPE_NAMES_TO_CODES[part.lower()])
+        else:
+            normalized.append(part)
+
+    return ",".join(sorted(normalized))
+
+
+def _normalize_price_value(value: str) -> str:
+    """
+    Normalize price values: strip commas, expand abbreviations.
+    e.g., '500k' → '500000', '2m' → '2000000', '1,500,000' → '1500000'
+    """
+    value = value.translate(PRICE_STRIP_TABLE).strip()
+
+    # Handle range format MIN-MAX
+    if "-" in value:
+        left, _, right = value.partition("-")
+        return f"{_expand_price_abbrev(left)}-{_expand_price_abbrev(right)}"
+
+    return _expand_price_abbrev(value)
+
+
+def _expand_price_abbrev(val: str) -> str:
+    """Expand price abbreviation: 500k → 500000, 2m → 2000000."""
+    val = val.strip()
+    multiplier = PRICE_ABBREV_MULTIPLIERS.get(val[-1:])
+    if multiplier is None:
+        return val
+    number = val[:-1]
+    # Whole numbers (the common case) skip the float round trip. isdecimal,
+    # not isdigit: int() rejects digit-like characters such as superscripts.
+    if number.isdecimal():
+        return str(int(number) * multiplier)
+    try:
+        return str(int(float(number) * multiplier))
+    except ValueError:
+        return val
+
+
+def _normalize_status_value(value: str) -> str:
+    """Map status aliases (active, in-contract, ...) to canonical values."""
+    return STATUS_ALIASES.get(value, value)
+
+
+def _normalize_sqft_value(value: str) -> str:
+    """Strip thousands separators from sqft values."""
+    return value.replace(",", "")
+
+
+def _normalize_boolean_value(value: str) -> str:
+    """Collapse truthy values (true, yes, allowed, ...) to '1'."""
+    return "1" if value in BOOLEAN_TRUE_VALUES else value
+
+
+def _normalize_subway_value(value: str) -> str:
+    """Uppercase subway line values: l → L."""
+    return value.upper()
+
+
+# Value normalizer per canonical filter key. Keys not listed (pets, zip,
+# keywords, ...) keep their value as-is.
+VALUE_NORMALIZERS = {
+    "type": _normalize_type_value,
+    "status": _normalize_status_value,
+    # Price/financial ranges
+    "price": _normalize_price_value,
+    "maintenance": _normalize_price_value,
+    "taxes": _normalize_price_value,
+    "common_charges": _normalize_price_value,
+    "ppsf": _normalize_price_value,
+    "sqft": _normalize_sqft_value,
+    # Boolean-like filters
+    **dict.fromkeys(
+        (
+            "no_fee", "furnished", "short_term", "owner", "guarantors_accepted",
+            "prewar", "new_development", "income_restricted",
+            "virtual_tour", "open_house",
+        ),
+        _normalize_boolean_value,
+    ),
+    "subway": _normalize_subway_value,
+}
+
+
+def _effective_location(parts: dict) -> str:
+    """Return the neighborhood if present, else the location (borough or
+    neighborhood-as-location)."""
+    return parts["neighborhood"] or parts["location"]
+
+
+def _mismatch(reason: str) -> tuple[bool, dict]:
+    """Build the (False, details) result for a failed URL comparison."""
+    return False, {"mismatches": [reason], "extra_filters": []}
+
+
 # ============================================================================
 # VERIFIER CLASS
 # ============================================================================
@@ -319,6 +613,13 @@ class StreetEasyUrlMatch(BaseMetric):
             self.gt_urls = [gt_url]
         else:
             self.gt_urls = gt_url
+        # Every matching agent URL must contain the GT's effective neighborhood
+        # (neighborhood, or location when no neighborhood), so precompute it
+        # per GT to reject hopeless URLs before the full parse.
+        self._gt_parsed = [self._parse_streeteasy_url(u) for u in self.gt_urls]
+        self._gt_required_tokens = [
+            {_effective_location(gt)} - {""} for gt in self._gt_parsed
+        ]
         self._found_match = False
         self._agent_url = ""
         self._matched_gt_url = ""
@@ -344,23 +645,26 @@ class StreetEasyUrlMatch(BaseMetric):
             return
 
         self._agent_url = url
+        url_lower = unquote(url).lower()
 
-        for gt_url in self.gt_urls:
+        for gt_url, required in zip(self.gt_urls, self._gt_required_tokens):
+            if not all(tok in url_lower for tok in required):
+                continue
             match, details = self._urls_match(url, gt_url)
             if match:
                 self._found_match = True
                 self._matched_gt_url = gt_url
                 self._match_details = details
-                logger.info(f"Match found: {url[:100]}...")
+                logger.info("Match found: {:.100}...", url)
                 return
 
-        logger.info(f"No match found: {url[:100]}...")
+        logger.info("No match found: {:.100}...", url)
 
     async def compute(self) -> FinalResult:
         """Compute final score (1.0 = match, 0.0 = no match)."""
         score = 1.0 if self._found_match else 0.0
         result = FinalResult(score=score)
-        logger.info(f"Final score: {score}")
+        logger.info("Final score: {}", score)
         return result
 
     async def compute_detailed(self) -> StreetEasyVerifierResult:
@@ -378,22 +682,36 @@ class StreetEasyUrlMatch(BaseMetric):
     # URL MATCHING
     # ========================================================================
 
+    def _parse_streeteasy_url(self, url: str) -> dict:
+        """Parse a StreetEasy URL into a fresh components dict (see ``_parse_url_parts``)."""
+        search_type, location, neighborhood, filters = _parse_streeteasy_url(url)
+        return {
+            "search_type": search_type,
+            "location": location,
+            "neighborhood": neighborhood,
+            "filters": dict(filters),
+        }
+
     def _urls_match(self, agent_url: str, gt_url: str) -> tuple[bool, dict]:
         """
         Check if two StreetEasy URLs represent the same search.
-        Returns (match_bool, details_dict).
+        Returns (match_bool, details_dict). The details dict is only built
+        once the outcome is known.
         """
-        details = {"mismatches": [], "extra_filters": []}
+        # Identical strings parse identically: no filters can differ or be extra.
+        # This skips two parses on exact self-matches, at the cost that such
+        # matches no longer exercise the location and filter comparisons;
+        # tests covering those must use a non-identical equivalent URL.
+        if agent_url == gt_url:
+            return True, {"mismatches": [], "extra_filters": []}
+
         try:
             agent_parts = self._parse_streeteasy_url(agent_url)
             gt_parts = self._parse_streeteasy_url(gt_url)
 
             # Compare search type (sale vs rent vs sold)
             if agent_parts["search_type"] != gt_parts["search_type"]:
-                details["mismatches"].append(
-                    f"Search type: '{agent_parts['search_type']}' vs '{gt_parts['search_type']}'"
-                )
-                return False, details
+                return _mismatch(f"Search type: '{agent_parts['search_type']}' vs '{gt_parts['search_type']}'")
 
             # Compare location and neighborhood
             # StreetEasy supports two URL formats for neighborhoods:
@@ -402,308 +720,37 @@ class StreetEasyUrlMatch(BaseMetric):
             # Both formats should match each other (browser-verified Feb 2026:
             # format 1 actually 404s on the real site, but we accept both in the
             # verifier for backward compatibility with existing GT data).
-            agent_loc = agent_parts["location"]
-            agent_nbhd = agent_parts["neighborhood"]
-            gt_loc = gt_parts["location"]
-            gt_nbhd = gt_parts["neighborhood"]
-
-            # Normalize: if one URL has borough+neighborhood and the other has
-            # neighborhood-as-location, extract the effective neighborhood
-            agent_effective_nbhd = agent_nbhd or agent_loc
-            gt_effective_nbhd = gt_nbhd or gt_loc
-
-            # Case 1: Both have same structure (both borough+nbhd or both nbhd-only)
-            if agent_loc == gt_loc and agent_nbhd == gt_nbhd:
-                pass  # Exact match
-            # Case 2: One has borough+neighborhood, other has neighborhood-as-location
-            elif agent_nbhd and not gt_nbhd and agent_nbhd == gt_loc:
-                pass  # e.g., agent: manhattan/upper-west-side, gt: upper-west-side
-            elif gt_nbhd and not agent_nbhd and gt_nbhd == agent_loc:
-                pass  # e.g., gt: manhattan/upper-west-side, agent: upper-west-side
-            # Case 3: Both have neighborhoods but via different structures
-            elif agent_effective_nbhd == gt_effective_nbhd:
-                pass  # Same effective neighborhood
-            else:
-                details["mismatches"].append(
-                    f"Location: '{agent_loc}/{agent_nbhd}' vs '{gt_loc}/{gt_nbhd}'"
+            # Every accepted case (same structure, borough+neighborhood vs
+            # neighborhood-as-location, or either way round) reduces to the
+            # effective neighborhood being equal on both sides.
+            if _effective_location(agent_parts) != _effective_location(gt_parts):
+                return _mismatch(
+                    f"Location: '{agent_parts['location']}/{agent_parts['neighborhood']}' "
+                    f"vs '{gt_parts['location']}/{gt_parts['neighborhood']}'"
                 )
-                return False, details
 
             # Compare filters (order-independent)
             agent_filters = agent_parts["filters"]
             gt_filters = gt_parts["filters"]
 
-            # Check all GT filters exist in agent
-            for key, gt_val in gt_filters.items():
-                if key not in agent_filters:
-                    details["mismatches"].append(f"Missing filter: {key}={gt_val}")
-                    return False, details
-                agent_val = agent_filters[key]
-                if not self._filter_values_match(key, agent_val, gt_val):
-                    details["mismatches"].append(
-                        f"Filter value mismatch: {key}: '{agent_val}' vs '{gt_val}'"
-                    )
-                    return False, details
+            # Check all GT filters exist in agent. Fast path: if every GT
+            # (key, value) pair appears verbatim in the agent's filters, the
+            # C-level items-view subset test settles it without the loop.
+            if not gt_filters.items() <= agent_filters.items():
+                for key, gt_val in gt_filters.items():
+                    if key not in agent_filters:
+                        return _mismatch(f"Missing filter: {key}={gt_val}")
+                    agent_val = agent_filters[key]
+                    if not self._filter_values_match(key, agent_val, gt_val):
+                        return _mismatch(f"Filter value mismatch: {key}: '{agent_val}' vs '{gt_val}'")
 
             # Check for extra filters in agent (note but don't fail)
-            extra = set(agent_filters.keys()) - set(gt_filters.keys())
-            if extra:
-                details["extra_filters"] = list(extra)
-
-            return True, details
+            extra = agent_filters.keys() - gt_filters.keys()
+            return True, {"mismatches": [], "extra_filters": list(extra)}
 
         except Exception as e:
             logger.error(f"Error comparing URLs: {e}")
-            details["mismatches"].append(f"Parse error: {str(e)}")
-            return False, details
-
-    # ========================================================================
-    # URL PARSING
-    # ========================================================================
-
-    def _parse_streeteasy_url(self, url: str) -> dict:
-        """
-        Parse a StreetEasy URL into normalized components.
-
-        Returns dict with keys:
-            search_type: "sale", "rent", or "sold"
-            location: borough name (lowercase)
-            neighborhood: neighborhood name (lowercase) or ""
-            filters: dict of normalized filter key -> value
-        """
-        url = url.strip()
-        url = unquote(url)
-
-        # Parse URL
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-
-        parsed = urlparse(url)
-        path = parsed.path.strip("/")
-        path_lower = path.lower()
-
-        result = {
-            "search_type": "",
-            "location": "",
-            "neighborhood": "",
-            "filters": {},
-        }
-
-        # Split path into segments
-        segments = [s for s in path_lower.split("/") if s]
-
-        if not segments:
-            return result
-
-        # Extract search type from first segment
-        if segments[0] in SEARCH_TYPES:
-            result["search_type"] = SEARCH_TYPES[segments[0]]
-            segments = segments[1:]
-        else:
-            result["search_type"] = "sale"
-
-        if not segments:
-            return result
-
-        # Extract location (borough) from next segment
-        location_segment = segments[0]
-        if ":" not in location_segment and ">=" not in location_segment:
-            result["location"] = location_segment
-            segments = segments[1:]
-        else:
-            return result
-
-        if not segments:
-            return result
-
-        # Check for neighborhood segment (before filters)
-        if segments and ":" not in segments[0] and ">=" not in segments[0] and "|" not in segments[0]:
-            result["neighborhood"] = segments[0]
-            segments = segments[1:]
-
-        if not segments:
-            return result
-
-        # Remaining segments contain filters (pipe-delimited)
-        filter_str = "/".join(segments)
-
-        # Split on pipe to get individual filters
-        raw_filters = filter_str.split("|")
-
-        for raw_filter in raw_filters:
-            raw_filter = raw_filter.strip()
-            if not raw_filter:
-                continue
-
-            key, value = self._parse_single_filter(raw_filter)
-            if key:
-                # Skip map/viewport filters
-                if key.lower().replace("-", "_") in IGNORED_FILTERS:
-                    continue
-                canonical_key, canonical_value = self._normalize_filter(key, value)
-
-                # Handle multi-value filters (e.g., subway:L|subway:1)
-                if canonical_key in result["filters"]:
-                    existing = result["filters"][canonical_key]
-                    existing_set = set(existing.split(","))
-                    new_set = set(canonical_value.split(","))
-                    merged = sorted(existing_set | new_set)
-                    result["filters"][canonical_key] = ",".join(merged)
-                else:
-                    result["filters"][canonical_key] = canonical_value
-
-        return result
-
-    def _parse_single_filter(self, raw: str) -> tuple[str, str]:
-        """
-        Parse a single filter string like 'price:500000-1000000' or 'beds>=2'.
-        Returns (key, value).
-        """
-        # Handle >= operator (beds>=2, baths>=1.5, sqft>=850)
-        if ">=" in raw:
-            parts = raw.split(">=", 1)
-            if len(parts) == 2:
-                key = parts[0].strip()
-                value = parts[1].strip() + "-"  # Convert to range: beds>=2 → beds:2-
-                return key, value
-
-        # Handle standard colon separator (price:500000-1000000)
-        if ":" in raw:
-            parts = raw.split(":", 1)
-            if len(parts) == 2:
-                return parts[0].strip(), parts[1].strip()
-
-        return "", ""
-
-    # ========================================================================
-    # NORMALIZATION
-    # ========================================================================
-
-    def _normalize_filter(self, key: str, value: str) -> tuple[str, str]:
-        """
-        Normalize a filter key and value to canonical forms.
-
-        Handles:
-        - amenities:X → key="amenities", value normalized
-        - type:D1,P1 → key="type", value normalized
-        - price normalization (commas, abbreviations)
-        - status aliases
-        - Boolean normalization
-        """
-        key = key.lower().strip()
-        value = value.strip().lower()
-
-        # Handle "amenities:" and "opt_amenities:" prefixes
-        # StreetEasy uses two prefixes depending on the "Must-have" toggle:
-        #   amenities:X     = Must-have ON (required amenity)
-        #   opt_amenities:X = Must-have OFF (optional/preferred amenity)
-        # Both are normalized to "amenities" key for matching, since task
-        # descriptions say "with parking" not "must-have parking".
-        # Supports single (amenities:doorman) and comma-separated
-        # (amenities:elevator,doorman) values (browser-verified Feb 2026)
-        if key in ("amenities", "opt_amenities"):
-            amenities = [a.strip() for a in value.split(",")]
-            normalized = []
-            for a in amenities:
-                canonical = AMENITY_ALIASES.get(a.replace("-", "_"), a)
-                normalized.append(canonical)
-            return "amenities", ",".join(sorted(normalized))
-
-        # Normalize key using aliases
-        key_underscore = key.replace("-", "_")
-        canonical_key = FILTER_NAME_ALIASES.get(
-            key_underscore, FILTER_NAME_ALIASES.get(key, key)
-        )
-
-        # Handle property type codes
-        if canonical_key == "type":
-            return "type", self._normalize_type_value(value)
-
-        # Handle status
-        if canonical_key == "status":
-            return "status", STATUS_ALIASES.get(value, value)
-
-        # Handle price/financial ranges
-        if canonical_key in ("price", "maintenance", "taxes", "common_charges", "ppsf"):
-            return canonical_key, self._normalize_price_value(value)
-
-        # Handle pets
-        if canonical_key == "pets":
-            return "pets", value  # Keep as-is: "allowed", "cats", etc.
-
-        # Handle sqft (strip commas)
-        if canonical_key == "sqft":
-            return "sqft", value.replace(",", "")
-
-        # Handle boolean-like filters
-        if canonical_key in (
-            "no_fee", "furnished", "short_term", "owner", "guarantors_accepted",
-            "prewar", "new_development", "income_restricted",
-            "virtual_tour", "open_house",
-        ):
-            if value in BOOLEAN_TRUE_VALUES:
-                return canonical_key, "1"
-            return canonical_key, value
-
-        # Handle subway lines (keep value as-is)
-        if canonical_key == "subway":
-            return "subway", value.upper()  # Normalize: l → L
-
-        return canonical_key, value
-
-    def _normalize_type_value(self, value: str) -> str:
-        """
-        Normalize property type value.
-        Handles: D1, P1, D1,P1, or human-readable names.
-        Returns comma-separated sorted codes.
-        """
-        value = value.strip().upper()
-
-        # If already code format (D1, P1, D1,P1)
-        parts = [p.strip() for p in value.split(",")]
-        normalized = []
-        for part in parts:
-            if part in PROPERTY_TYPE_CODES:
-                normalized.append(part)
-            elif part.lower() in PROPERTY_TYPE_NAMES_TO_CODES:
-                normalized.append(PROPERTY_TYPE_NAMES_TO_CODES[part.lower()])
-            else:
-                normalized.append(part)
-
-        return ",".join(sorted(normalized))
-
-    def _normalize_price_value(self, value: str) -> str:
-        """
-        Normalize price values: strip commas, expand abbreviations.
-        e.g., '500k' → '500000', '2m' → '2000000', '1,500,000' → '1500000'
-        """
-        value = value.replace(",", "").replace("$", "").strip()
-
-        # Handle range format MIN-MAX
-        if "-" in value:
-            parts = value.split("-", 1)
-            left = self._expand_price_abbrev(parts[0]) if parts[0] else ""
-            right = self._expand_price_abbrev(parts[1]) if parts[1] else ""
-            return f"{left}-{right}"
-
-        return self._expand_price_abbrev(value)
-
-    def _expand_price_abbrev(self, val: str) -> str:
-        """Expand price abbreviation: 500k → 500000, 2m → 2000000."""
-        val = val.strip()
-        if not val:
-            return val
-        if val.endswith("m"):
-            try:
-                return str(int(float(val[:-1]) * 1_000_000))
-            except ValueError:
-                return val
-        if val.endswith("k"):
-            try:
-                return str(int(float(val[:-1]) * 1_000))
-            except ValueError:
-                return val
-        return val
+            return _mismatch(f"Parse error: {str(e)}")
 
     def _filter_values_match(self, key: str, agent_val: str, gt_val: str) -> bool:
         """
@@ -715,11 +762,11 @@ class StreetEasyUrlMatch(BaseMetric):
         if agent_val == gt_val:
             return True
 
-        # Multi-value comparison (type:D1,P1 vs type:P1,D1)
+        # Multi-value comparison (type:D1,P1 vs type:P1,D1). Compared as sets:
+        # order is irrelevant and repeated values (doorman,doorman, or D1,condo
+        # once aliases normalize) must not count twice.
         if "," in agent_val or "," in gt_val:
-            agent_set = set(agent_val.split(","))
-            gt_set = set(gt_val.split(","))
-            return agent_set == gt_set
+            return set(agent_val.split(",")) == set(gt_val.split(","))
 
         # Boolean equivalence
         if agent_val in BOOLEAN_TRUE_VALUES and gt_val in BOOLEAN_TRUE_VALUES:
@@ -732,6 +779,10 @@ class StreetEasyUrlMatch(BaseMetric):
 # TASK CONFIG GENERATION
 # ============================================================================
 
+# Import path of the verifier, resolved once for every generated task config
+_STREETEASY_EVAL_TARGET = get_import_path(StreetEasyUrlMatch)
+
+
 def generate_task_config(
     task: str,
     location: str,
@@ -757,8 +808,7 @@ def generate_task_config(
         raise ValueError("Either 'gt_url' or 'ground_truth_url' must be provided.")
 
     user_metadata = initialize_user_metadata(timezone, location, timestamp)
-    eval_target = get_import_path(StreetEasyUrlMatch)
-    eval_config = {"_target_": eval_target, "gt_url": gt_url}
+    eval_config = {"_target_": _STREETEASY_EVAL_TARGET, "gt_url": gt_url}
     return BaseTaskConfig(
         url=url, task=task, user_metadata=user_metadata, eval_config=eval_config
     )
@@ -770,600 +820,679 @@ def generate_task_config(
 # ============================================================================
 
 if __name__ == "__main__":
-    import asyncio
-
     print("=" * 80)
     print("STREETEASY URL VERIFIER — COMPREHENSIVE EDGE CASE TEST SUITE")
     print("Chrome-Verified Patterns (Feb 2026)")
     print("=" * 80)
 
-    async def run_comprehensive_tests():
-        """Run all edge case tests."""
-        total_tests = 0
-        passed_tests = 0
-
-        def run_test(name, gt_url, agent_url, expected_match=True):
-            nonlocal total_tests, passed_tests
-            total_tests += 1
-            evaluator = StreetEasyUrlMatch(gt_url=gt_url)
-            match, details = evaluator._urls_match(agent_url, gt_url)
-            status = "✅" if match == expected_match else "❌"
-            if match == expected_match:
-                passed_tests += 1
-            else:
-                extra = ""
-                if details.get("mismatches"):
-                    extra = f" — {details['mismatches']}"
-                print(f"  {status} {name}{extra}")
-                return
-            print(f"  {status} {name}")
-
+    # (section, [(name, gt_url, agent_url, expected_match), ...])
+    EDGE_CASE_SECTIONS = [
         # ================================================================
         # 1. SEARCH TYPE DETECTION
         # ================================================================
-        print("\n📁 1. Search Type Detection")
-        print("-" * 40)
-
-        run_test(
-            "Sale search type",
-            "https://streeteasy.com/for-sale/manhattan",
-            "https://streeteasy.com/for-sale/manhattan",
-        )
-        run_test(
-            "Rental search type",
-            "https://streeteasy.com/for-rent/brooklyn",
-            "https://streeteasy.com/for-rent/brooklyn",
-        )
-        run_test(
-            "Sold search type",
-            "https://streeteasy.com/sold/manhattan",
-            "https://streeteasy.com/sold/manhattan",
-        )
-        run_test(
-            "Sale vs Rent should NOT match",
-            "https://streeteasy.com/for-sale/manhattan",
-            "https://streeteasy.com/for-rent/manhattan",
-            expected_match=False,
-        )
-        run_test(
-            "Sale vs Sold should NOT match",
-            "https://streeteasy.com/for-sale/manhattan",
-            "https://streeteasy.com/sold/manhattan",
-            expected_match=False,
-        )
-
+        ("📁 1. Search Type Detection", [
+            (
+                "Sale search type",
+                "https://streeteasy.com/for-sale/manhattan",
+                "https://streeteasy.com/for-sale/manhattan",
+                True,
+            ),
+            (
+                "Rental search type",
+                "https://streeteasy.com/for-rent/brooklyn",
+                "https://streeteasy.com/for-rent/brooklyn",
+                True,
+            ),
+            (
+                "Sold search type",
+                "https://streeteasy.com/sold/manhattan",
+                "https://streeteasy.com/sold/manhattan",
+                True,
+            ),
+            (
+                "Sale vs Rent should NOT match",
+                "https://streeteasy.com/for-sale/manhattan",
+                "https://streeteasy.com/for-rent/manhattan",
+                False,
+            ),
+            (
+                "Sale vs Sold should NOT match",
+                "https://streeteasy.com/for-sale/manhattan",
+                "https://streeteasy.com/sold/manhattan",
+                False,
+            ),
+        ]),
         # ================================================================
         # 2. LOCATION PARSING
         # ================================================================
-        print("\n📍 2. Location Parsing")
-        print("-" * 40)
-
-        run_test(
-            "Manhattan location",
-            "https://streeteasy.com/for-sale/manhattan",
-            "https://streeteasy.com/for-sale/manhattan",
-        )
-        run_test(
-            "Brooklyn location",
-            "https://streeteasy.com/for-rent/brooklyn",
-            "https://streeteasy.com/for-rent/brooklyn",
-        )
-        run_test(
-            "Queens location",
-            "https://streeteasy.com/for-sale/queens",
-            "https://streeteasy.com/for-sale/queens",
-        )
-        run_test(
-            "Manhattan vs Brooklyn should NOT match",
-            "https://streeteasy.com/for-sale/manhattan",
-            "https://streeteasy.com/for-sale/brooklyn",
-            expected_match=False,
-        )
-        run_test(
-            "Neighborhood location",
-            "https://streeteasy.com/for-sale/manhattan/upper-west-side",
-            "https://streeteasy.com/for-sale/manhattan/upper-west-side",
-        )
-        run_test(
-            "Staten Island location",
-            "https://streeteasy.com/for-sale/staten-island",
-            "https://streeteasy.com/for-sale/staten-island",
-        )
-
+        ("📍 2. Location Parsing", [
+            (
+                "Manhattan location",
+                "https://streeteasy.com/for-sale/manhattan",
+                "https://streeteasy.com/for-sale/manhattan",
+                True,
+            ),
+            (
+                "Brooklyn location",
+                "https://streeteasy.com/for-rent/brooklyn",
+                "https://streeteasy.com/for-rent/brooklyn",
+                True,
+            ),
+            (
+                "Queens location",
+                "https://streeteasy.com/for-sale/queens",
+                "https://streeteasy.com/for-sale/queens",
+                True,
+            ),
+            (
+                "Manhattan vs Brooklyn should NOT match",
+                "https://streeteasy.com/for-sale/manhattan",
+                "https://streeteasy.com/for-sale/brooklyn",
+                False,
+            ),
+            (
+                "Neighborhood location",
+                "https://streeteasy.com/for-sale/manhattan/upper-west-side",
+                "https://streeteasy.com/for-sale/manhattan/upper-west-side",
+                True,
+            ),
+            (
+                "Staten Island location",
+                "https://streeteasy.com/for-sale/staten-island",
+                "https://streeteasy.com/for-sale/staten-island",
+                True,
+            ),
+        ]),
         # ================================================================
         # 3. PRICE FILTERS
         # ================================================================
-        print("\n💰 3. Price Filters")
-        print("-" * 40)
-
-        run_test(
-            "Price range (Chrome-verified)",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-700000",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-700000",
-        )
-        run_test(
-            "Min price only",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-",
-        )
-        run_test(
-            "Max price only",
-            "https://streeteasy.com/for-sale/manhattan/price:-1000000",
-            "https://streeteasy.com/for-sale/manhattan/price:-1000000",
-        )
-        run_test(
-            "Price with commas vs without",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-1000000",
-            "https://streeteasy.com/for-sale/manhattan/price:500,000-1,000,000",
-        )
-        run_test(
-            "Price abbreviation k",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-1000000",
-            "https://streeteasy.com/for-sale/manhattan/price:500k-1000k",
-        )
-        run_test(
-            "Price abbreviation m",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-2000000",
-            "https://streeteasy.com/for-sale/manhattan/price:500k-2m",
-        )
-        run_test(
-            "Wrong price should NOT match",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-1000000",
-            "https://streeteasy.com/for-sale/manhattan/price:300000-800000",
-            expected_match=False,
-        )
-
+        ("💰 3. Price Filters", [
+            (
+                "Price range (Chrome-verified)",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-700000",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-700000",
+                True,
+            ),
+            (
+                "Min price only",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-",
+                True,
+            ),
+            (
+                "Max price only",
+                "https://streeteasy.com/for-sale/manhattan/price:-1000000",
+                "https://streeteasy.com/for-sale/manhattan/price:-1000000",
+                True,
+            ),
+            (
+                "Price with commas vs without",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-1000000",
+                "https://streeteasy.com/for-sale/manhattan/price:500,000-1,000,000",
+                True,
+            ),
+            (
+                "Price abbreviation k",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-1000000",
+                "https://streeteasy.com/for-sale/manhattan/price:500k-1000k",
+                True,
+            ),
+            (
+                "Price abbreviation m",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-2000000",
+                "https://streeteasy.com/for-sale/manhattan/price:500k-2m",
+                True,
+            ),
+            (
+                "Superscript digit price is compared as-is",
+                "https://streeteasy.com/for-sale/manhattan/price:²k",
+                "https://streeteasy.com/for-sale/manhattan/price:²k/",
+                True,
+            ),
+            (
+                "Wrong price should NOT match",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-1000000",
+                "https://streeteasy.com/for-sale/manhattan/price:300000-800000",
+                False,
+            ),
+        ]),
         # ================================================================
         # 4. BEDS FILTER (Chrome-Verified)
         # ================================================================
-        print("\n🛏️  4. Beds Filter (Chrome-Verified)")
-        print("-" * 40)
-
-        run_test(
-            "Exact beds",
-            "https://streeteasy.com/for-sale/manhattan/beds:2",
-            "https://streeteasy.com/for-sale/manhattan/beds:2",
-        )
-        run_test(
-            "Studio (beds:0)",
-            "https://streeteasy.com/for-rent/manhattan/beds:0",
-            "https://streeteasy.com/for-rent/manhattan/beds:0",
-        )
-        run_test(
-            "Min beds with >= (Chrome-verified)",
-            "https://streeteasy.com/for-rent/manhattan/beds>=2",
-            "https://streeteasy.com/for-rent/manhattan/beds>=2",
-        )
-        run_test(
-            "Different beds should NOT match",
-            "https://streeteasy.com/for-sale/manhattan/beds:2",
-            "https://streeteasy.com/for-sale/manhattan/beds:3",
-            expected_match=False,
-        )
-
+        ("🛏️  4. Beds Filter (Chrome-Verified)", [
+            (
+                "Exact beds",
+                "https://streeteasy.com/for-sale/manhattan/beds:2",
+                "https://streeteasy.com/for-sale/manhattan/beds:2",
+                True,
+            ),
+            (
+                "Studio (beds:0)",
+                "https://streeteasy.com/for-rent/manhattan/beds:0",
+                "https://streeteasy.com/for-rent/manhattan/beds:0",
+                True,
+            ),
+            (
+                "Min beds with >= (Chrome-verified)",
+                "https://streeteasy.com/for-rent/manhattan/beds>=2",
+                "https://streeteasy.com/for-rent/manhattan/beds>=2",
+                True,
+            ),
+            (
+                "Different beds should NOT match",
+                "https://streeteasy.com/for-sale/manhattan/beds:2",
+                "https://streeteasy.com/for-sale/manhattan/beds:3",
+                False,
+            ),
+        ]),
         # ================================================================
         # 5. BATHS FILTER (Chrome-Verified)
         # ================================================================
-        print("\n🚿 5. Baths Filter")
-        print("-" * 40)
-
-        run_test(
-            "Exact baths (Chrome-verified)",
-            "https://streeteasy.com/for-sale/manhattan/baths:1",
-            "https://streeteasy.com/for-sale/manhattan/baths:1",
-        )
-        run_test(
-            "Min baths with >=",
-            "https://streeteasy.com/for-rent/manhattan/baths>=1.5",
-            "https://streeteasy.com/for-rent/manhattan/baths>=1.5",
-        )
-        run_test(
-            "Beds + Baths combo (Chrome-verified)",
-            "https://streeteasy.com/for-sale/manhattan/beds:2|baths:1",
-            "https://streeteasy.com/for-sale/manhattan/beds:2|baths:1",
-        )
-
+        ("🚿 5. Baths Filter", [
+            (
+                "Exact baths (Chrome-verified)",
+                "https://streeteasy.com/for-sale/manhattan/baths:1",
+                "https://streeteasy.com/for-sale/manhattan/baths:1",
+                True,
+            ),
+            (
+                "Min baths with >=",
+                "https://streeteasy.com/for-rent/manhattan/baths>=1.5",
+                "https://streeteasy.com/for-rent/manhattan/baths>=1.5",
+                True,
+            ),
+            (
+                "Beds + Baths combo (Chrome-verified)",
+                "https://streeteasy.com/for-sale/manhattan/beds:2|baths:1",
+                "https://streeteasy.com/for-sale/manhattan/beds:2|baths:1",
+                True,
+            ),
+        ]),
         # ================================================================
         # 6. PROPERTY TYPE — CODES (Chrome-Verified ✅)
         # ================================================================
-        print("\n🏠 6. Property Type — Codes (Chrome-Verified)")
-        print("-" * 40)
-
-        run_test(
-            "Condo: type:D1 (Chrome-verified)",
-            "https://streeteasy.com/for-sale/manhattan/type:D1",
-            "https://streeteasy.com/for-sale/manhattan/type:D1",
-        )
-        run_test(
-            "Co-op: type:P1 (Chrome-verified)",
-            "https://streeteasy.com/for-sale/manhattan/type:P1",
-            "https://streeteasy.com/for-sale/manhattan/type:P1",
-        )
-        run_test(
-            "Combo: type:D1,P1 (Chrome-verified comma-delimited)",
-            "https://streeteasy.com/for-sale/manhattan/type:D1,P1",
-            "https://streeteasy.com/for-sale/manhattan/type:D1,P1",
-        )
-        run_test(
-            "Combo order independent: D1,P1 vs P1,D1",
-            "https://streeteasy.com/for-sale/manhattan/type:D1,P1",
-            "https://streeteasy.com/for-sale/manhattan/type:P1,D1",
-        )
-        run_test(
-            "Human-readable condo → D1",
-            "https://streeteasy.com/for-sale/manhattan/type:D1",
-            "https://streeteasy.com/for-sale/manhattan/type:condo",
-        )
-        run_test(
-            "Human-readable co-op → P1",
-            "https://streeteasy.com/for-sale/manhattan/type:P1",
-            "https://streeteasy.com/for-sale/manhattan/type:coop",
-        )
-        run_test(
-            "Human-readable condos → D1",
-            "https://streeteasy.com/for-sale/manhattan/type:D1",
-            "https://streeteasy.com/for-sale/manhattan/type:condos",
-        )
-        run_test(
-            "Wrong type should NOT match",
-            "https://streeteasy.com/for-sale/manhattan/type:D1",
-            "https://streeteasy.com/for-sale/manhattan/type:P1",
-            expected_match=False,
-        )
-
+        ("🏠 6. Property Type — Codes (Chrome-Verified)", [
+            (
+                "Condo: type:D1 (Chrome-verified)",
+                "https://streeteasy.com/for-sale/manhattan/type:D1",
+                "https://streeteasy.com/for-sale/manhattan/type:D1",
+                True,
+            ),
+            (
+                "Co-op: type:P1 (Chrome-verified)",
+                "https://streeteasy.com/for-sale/manhattan/type:P1",
+                "https://streeteasy.com/for-sale/manhattan/type:P1",
+                True,
+            ),
+            (
+                "Combo: type:D1,P1 (Chrome-verified comma-delimited)",
+                "https://streeteasy.com/for-sale/manhattan/type:D1,P1",
+                "https://streeteasy.com/for-sale/manhattan/type:D1,P1",
+                True,
+            ),
+            (
+                "Combo order independent: D1,P1 vs P1,D1",
+                "https://streeteasy.com/for-sale/manhattan/type:D1,P1",
+                "https://streeteasy.com/for-sale/manhattan/type:P1,D1",
+                True,
+            ),
+            (
+                "Human-readable condo → D1",
+                "https://streeteasy.com/for-sale/manhattan/type:D1",
+                "https://streeteasy.com/for-sale/manhattan/type:condo",
+                True,
+            ),
+            (
+                "Human-readable co-op → P1",
+                "https://streeteasy.com/for-sale/manhattan/type:P1",
+                "https://streeteasy.com/for-sale/manhattan/type:coop",
+                True,
+            ),
+            (
+                "Human-readable condos → D1",
+                "https://streeteasy.com/for-sale/manhattan/type:D1",
+                "https://streeteasy.com/for-sale/manhattan/type:condos",
+                True,
+            ),
+            (
+                "Wrong type should NOT match",
+                "https://streeteasy.com/for-sale/manhattan/type:D1",
+                "https://streeteasy.com/for-sale/manhattan/type:P1",
+                False,
+            ),
+            (
+                "Type alias repeating a code: D1,condo == D1",
+                "https://streeteasy.com/for-sale/manhattan/type:D1",
+                "https://streeteasy.com/for-sale/manhattan/type:D1,condo",
+                True,
+            ),
+        ]),
         # ================================================================
         # 7. AMENITIES — amenities: PREFIX (Chrome-Verified ✅)
         # ================================================================
-        print("\n✨ 7. Amenities — amenities: prefix (Chrome-Verified)")
-        print("-" * 40)
-
-        run_test(
-            "Doorman (Chrome-verified: amenities:doorman)",
-            "https://streeteasy.com/for-sale/manhattan/amenities:doorman",
-            "https://streeteasy.com/for-sale/manhattan/amenities:doorman",
-        )
-        run_test(
-            "Elevator (Chrome-verified: amenities:elevator)",
-            "https://streeteasy.com/for-sale/manhattan/amenities:elevator",
-            "https://streeteasy.com/for-sale/manhattan/amenities:elevator",
-        )
-        run_test(
-            "Gym (Chrome-verified: amenities:gym)",
-            "https://streeteasy.com/for-sale/manhattan/amenities:gym",
-            "https://streeteasy.com/for-sale/manhattan/amenities:gym",
-        )
-        run_test(
-            "Laundry (Chrome-verified: amenities:laundry)",
-            "https://streeteasy.com/for-sale/manhattan/amenities:laundry",
-            "https://streeteasy.com/for-sale/manhattan/amenities:laundry",
-        )
-        run_test(
-            "Doorman + Elevator combo",
-            "https://streeteasy.com/for-sale/manhattan/amenities:doorman|amenities:elevator",
-            "https://streeteasy.com/for-sale/manhattan/amenities:doorman|amenities:elevator",
-        )
-        run_test(
-            "In-unit laundry",
-            "https://streeteasy.com/for-rent/manhattan/amenities:in_unit_laundry",
-            "https://streeteasy.com/for-rent/manhattan/amenities:in_unit_laundry",
-        )
-        run_test(
-            "Amenity alias: fitness → gym",
-            "https://streeteasy.com/for-sale/manhattan/amenities:gym",
-            "https://streeteasy.com/for-sale/manhattan/amenities:fitness",
-        )
-
+        ("✨ 7. Amenities — amenities: prefix (Chrome-Verified)", [
+            (
+                "Doorman (Chrome-verified: amenities:doorman)",
+                "https://streeteasy.com/for-sale/manhattan/amenities:doorman",
+                "https://streeteasy.com/for-sale/manhattan/amenities:doorman",
+                True,
+            ),
+            (
+                "Elevator (Chrome-verified: amenities:elevator)",
+                "https://streeteasy.com/for-sale/manhattan/amenities:elevator",
+                "https://streeteasy.com/for-sale/manhattan/amenities:elevator",
+                True,
+            ),
+            (
+                "Gym (Chrome-verified: amenities:gym)",
+                "https://streeteasy.com/for-sale/manhattan/amenities:gym",
+                "https://streeteasy.com/for-sale/manhattan/amenities:gym",
+                True,
+            ),
+            (
+                "Laundry (Chrome-verified: amenities:laundry)",
+                "https://streeteasy.com/for-sale/manhattan/amenities:laundry",
+                "https://streeteasy.com/for-sale/manhattan/amenities:laundry",
+                True,
+            ),
+            (
+                "Doorman + Elevator combo",
+                "https://streeteasy.com/for-sale/manhattan/amenities:doorman|amenities:elevator",
+                "https://streeteasy.com/for-sale/manhattan/amenities:doorman|amenities:elevator",
+                True,
+            ),
+            (
+                "In-unit laundry",
+                "https://streeteasy.com/for-rent/manhattan/amenities:in_unit_laundry",
+                "https://streeteasy.com/for-rent/manhattan/amenities:in_unit_laundry",
+                True,
+            ),
+            (
+                "Amenity alias: fitness → gym",
+                "https://streeteasy.com/for-sale/manhattan/amenities:gym",
+                "https://streeteasy.com/for-sale/manhattan/amenities:fitness",
+                True,
+            ),
+            (
+                "Repeated amenity: doorman,doorman == doorman",
+                "https://streeteasy.com/for-sale/manhattan/amenities:doorman",
+                "https://streeteasy.com/for-sale/manhattan/amenities:doorman,doorman",
+                True,
+            ),
+            (
+                "Amenity alias repeating a value: gym,fitness == gym",
+                "https://streeteasy.com/for-sale/manhattan/amenities:gym",
+                "https://streeteasy.com/for-sale/manhattan/amenities:gym,fitness",
+                True,
+            ),
+        ]),
         # ================================================================
         # 7b. OPT_AMENITIES (Must-have toggle OFF, Chrome-Verified ✅)
         # ================================================================
-        print("\n✨ 7b. Optional Amenities — opt_amenities: prefix (Chrome-Verified)")
-        print("-" * 40)
-
-        run_test(
-            "opt_amenities:parking matches amenities:parking",
-            "https://streeteasy.com/for-sale/brooklyn/amenities:parking",
-            "https://streeteasy.com/for-sale/brooklyn/opt_amenities:parking",
-        )
-        run_test(
-            "opt_amenities:doorman,gym matches amenities:doorman,gym",
-            "https://streeteasy.com/for-sale/manhattan/amenities:doorman,gym",
-            "https://streeteasy.com/for-sale/manhattan/opt_amenities:doorman,gym",
-        )
-        run_test(
-            "amenities:parking matches opt_amenities:parking (reverse)",
-            "https://streeteasy.com/for-sale/brooklyn/opt_amenities:parking",
-            "https://streeteasy.com/for-sale/brooklyn/amenities:parking",
-        )
-        run_test(
-            "opt_amenities with other filters",
-            "https://streeteasy.com/for-sale/brooklyn/type:D1|beds:2|amenities:parking",
-            "https://streeteasy.com/for-sale/brooklyn/type:D1|beds:2|opt_amenities:parking",
-        )
-        run_test(
-            "opt_amenities does NOT match different amenity",
-            "https://streeteasy.com/for-sale/brooklyn/opt_amenities:parking",
-            "https://streeteasy.com/for-sale/brooklyn/opt_amenities:gym",
-            expected_match=False,
-        )
-
+        ("✨ 7b. Optional Amenities — opt_amenities: prefix (Chrome-Verified)", [
+            (
+                "opt_amenities:parking matches amenities:parking",
+                "https://streeteasy.com/for-sale/brooklyn/amenities:parking",
+                "https://streeteasy.com/for-sale/brooklyn/opt_amenities:parking",
+                True,
+            ),
+            (
+                "opt_amenities:doorman,gym matches amenities:doorman,gym",
+                "https://streeteasy.com/for-sale/manhattan/amenities:doorman,gym",
+                "https://streeteasy.com/for-sale/manhattan/opt_amenities:doorman,gym",
+                True,
+            ),
+            (
+                "amenities:parking matches opt_amenities:parking (reverse)",
+                "https://streeteasy.com/for-sale/brooklyn/opt_amenities:parking",
+                "https://streeteasy.com/for-sale/brooklyn/amenities:parking",
+                True,
+            ),
+            (
+                "opt_amenities with other filters",
+                "https://streeteasy.com/for-sale/brooklyn/type:D1|beds:2|amenities:parking",
+                "https://streeteasy.com/for-sale/brooklyn/type:D1|beds:2|opt_amenities:parking",
+                True,
+            ),
+            (
+                "opt_amenities does NOT match different amenity",
+                "https://streeteasy.com/for-sale/brooklyn/opt_amenities:parking",
+                "https://streeteasy.com/for-sale/brooklyn/opt_amenities:gym",
+                False,
+            ),
+        ]),
         # ================================================================
         # 8. PETS FILTER (Chrome-Verified ✅)
         # ================================================================
-        print("\n🐾 8. Pets Filter (Chrome-Verified)")
-        print("-" * 40)
-
-        run_test(
-            "Pets allowed (Chrome-verified)",
-            "https://streeteasy.com/for-sale/manhattan/pets:allowed",
-            "https://streeteasy.com/for-sale/manhattan/pets:allowed",
-        )
-        run_test(
-            "Pets NOT match different value",
-            "https://streeteasy.com/for-sale/manhattan/pets:allowed",
-            "https://streeteasy.com/for-sale/manhattan/pets:none",
-            expected_match=False,
-        )
-
+        ("🐾 8. Pets Filter (Chrome-Verified)", [
+            (
+                "Pets allowed (Chrome-verified)",
+                "https://streeteasy.com/for-sale/manhattan/pets:allowed",
+                "https://streeteasy.com/for-sale/manhattan/pets:allowed",
+                True,
+            ),
+            (
+                "Pets NOT match different value",
+                "https://streeteasy.com/for-sale/manhattan/pets:allowed",
+                "https://streeteasy.com/for-sale/manhattan/pets:none",
+                False,
+            ),
+        ]),
         # ================================================================
         # 9. STATUS FILTER (Chrome-Verified)
         # ================================================================
-        print("\n📊 9. Status Filter")
-        print("-" * 40)
-
-        run_test(
-            "Status open",
-            "https://streeteasy.com/for-sale/manhattan/status:open",
-            "https://streeteasy.com/for-sale/manhattan/status:open",
-        )
-        run_test(
-            "Status sold (Chrome-verified)",
-            "https://streeteasy.com/for-sale/manhattan/status:sold",
-            "https://streeteasy.com/for-sale/manhattan/status:sold",
-        )
-        run_test(
-            "Status active = open alias",
-            "https://streeteasy.com/for-sale/manhattan/status:open",
-            "https://streeteasy.com/for-sale/manhattan/status:active",
-        )
-        run_test(
-            "Status in_contract vs in-contract",
-            "https://streeteasy.com/for-sale/manhattan/status:in_contract",
-            "https://streeteasy.com/for-sale/manhattan/status:in-contract",
-        )
-
+        ("📊 9. Status Filter", [
+            (
+                "Status open",
+                "https://streeteasy.com/for-sale/manhattan/status:open",
+                "https://streeteasy.com/for-sale/manhattan/status:open",
+                True,
+            ),
+            (
+                "Status sold (Chrome-verified)",
+                "https://streeteasy.com/for-sale/manhattan/status:sold",
+                "https://streeteasy.com/for-sale/manhattan/status:sold",
+                True,
+            ),
+            (
+                "Status active = open alias",
+                "https://streeteasy.com/for-sale/manhattan/status:open",
+                "https://streeteasy.com/for-sale/manhattan/status:active",
+                True,
+            ),
+            (
+                "Status in_contract vs in-contract",
+                "https://streeteasy.com/for-sale/manhattan/status:in_contract",
+                "https://streeteasy.com/for-sale/manhattan/status:in-contract",
+                True,
+            ),
+        ]),
         # ================================================================
         # 10. SQUARE FOOTAGE
         # ================================================================
-        print("\n📐 10. Square Footage")
-        print("-" * 40)
-
-        run_test(
-            "SQFT range",
-            "https://streeteasy.com/for-sale/manhattan/sqft:750-1200",
-            "https://streeteasy.com/for-sale/manhattan/sqft:750-1200",
-        )
-        run_test(
-            "Min SQFT with >=",
-            "https://streeteasy.com/for-sale/manhattan/sqft>=850",
-            "https://streeteasy.com/for-sale/manhattan/sqft>=850",
-        )
-
+        ("📐 10. Square Footage", [
+            (
+                "SQFT range",
+                "https://streeteasy.com/for-sale/manhattan/sqft:750-1200",
+                "https://streeteasy.com/for-sale/manhattan/sqft:750-1200",
+                True,
+            ),
+            (
+                "Min SQFT with >=",
+                "https://streeteasy.com/for-sale/manhattan/sqft>=850",
+                "https://streeteasy.com/for-sale/manhattan/sqft>=850",
+                True,
+            ),
+        ]),
         # ================================================================
         # 11. RENTAL-SPECIFIC
         # ================================================================
-        print("\n🏢 11. Rental-Specific Filters")
-        print("-" * 40)
-
-        run_test(
-            "No fee",
-            "https://streeteasy.com/for-rent/manhattan/no_fee:1",
-            "https://streeteasy.com/for-rent/manhattan/no_fee:1",
-        )
-        run_test(
-            "No-fee alias (hyphenated)",
-            "https://streeteasy.com/for-rent/manhattan/no_fee:1",
-            "https://streeteasy.com/for-rent/manhattan/no-fee:1",
-        )
-        run_test(
-            "Furnished",
-            "https://streeteasy.com/for-rent/manhattan/furnished:1",
-            "https://streeteasy.com/for-rent/manhattan/furnished:1",
-        )
-        run_test(
-            "Boolean true vs 1",
-            "https://streeteasy.com/for-rent/manhattan/no_fee:1",
-            "https://streeteasy.com/for-rent/manhattan/no_fee:true",
-        )
-
+        ("🏢 11. Rental-Specific Filters", [
+            (
+                "No fee",
+                "https://streeteasy.com/for-rent/manhattan/no_fee:1",
+                "https://streeteasy.com/for-rent/manhattan/no_fee:1",
+                True,
+            ),
+            (
+                "No-fee alias (hyphenated)",
+                "https://streeteasy.com/for-rent/manhattan/no_fee:1",
+                "https://streeteasy.com/for-rent/manhattan/no-fee:1",
+                True,
+            ),
+            (
+                "Furnished",
+                "https://streeteasy.com/for-rent/manhattan/furnished:1",
+                "https://streeteasy.com/for-rent/manhattan/furnished:1",
+                True,
+            ),
+            (
+                "Boolean true vs 1",
+                "https://streeteasy.com/for-rent/manhattan/no_fee:1",
+                "https://streeteasy.com/for-rent/manhattan/no_fee:true",
+                True,
+            ),
+        ]),
         # ================================================================
         # 12. BUILDING FEATURES
         # ================================================================
-        print("\n🏗️  12. Building Features")
-        print("-" * 40)
-
-        run_test(
-            "Pre-war",
-            "https://streeteasy.com/for-sale/manhattan/prewar:1",
-            "https://streeteasy.com/for-sale/manhattan/prewar:1",
-        )
-        run_test(
-            "Pre-war alias (pre_war)",
-            "https://streeteasy.com/for-sale/manhattan/prewar:1",
-            "https://streeteasy.com/for-sale/manhattan/pre_war:1",
-        )
-        run_test(
-            "Pre-war alias (pre-war)",
-            "https://streeteasy.com/for-sale/manhattan/prewar:1",
-            "https://streeteasy.com/for-sale/manhattan/pre-war:1",
-        )
-        run_test(
-            "New development",
-            "https://streeteasy.com/for-sale/manhattan/new_development:1",
-            "https://streeteasy.com/for-sale/manhattan/new_development:1",
-        )
-
+        ("🏗️  12. Building Features", [
+            (
+                "Pre-war",
+                "https://streeteasy.com/for-sale/manhattan/prewar:1",
+                "https://streeteasy.com/for-sale/manhattan/prewar:1",
+                True,
+            ),
+            (
+                "Pre-war alias (pre_war)",
+                "https://streeteasy.com/for-sale/manhattan/prewar:1",
+                "https://streeteasy.com/for-sale/manhattan/pre_war:1",
+                True,
+            ),
+            (
+                "Pre-war alias (pre-war)",
+                "https://streeteasy.com/for-sale/manhattan/prewar:1",
+                "https://streeteasy.com/for-sale/manhattan/pre-war:1",
+                True,
+            ),
+            (
+                "New development",
+                "https://streeteasy.com/for-sale/manhattan/new_development:1",
+                "https://streeteasy.com/for-sale/manhattan/new_development:1",
+                True,
+            ),
+        ]),
         # ================================================================
         # 13. SALE-SPECIFIC
         # ================================================================
-        print("\n💼 13. Sale-Specific Filters")
-        print("-" * 40)
-
-        run_test(
-            "Sale type foreclosure",
-            "https://streeteasy.com/for-sale/manhattan/sale_type:foreclosure",
-            "https://streeteasy.com/for-sale/manhattan/sale_type:foreclosure",
-        )
-
+        ("💼 13. Sale-Specific Filters", [
+            (
+                "Sale type foreclosure",
+                "https://streeteasy.com/for-sale/manhattan/sale_type:foreclosure",
+                "https://streeteasy.com/for-sale/manhattan/sale_type:foreclosure",
+                True,
+            ),
+        ]),
         # ================================================================
         # 14. SUBWAY / TRANSIT
         # ================================================================
-        print("\n🚇 14. Subway / Transit")
-        print("-" * 40)
-
-        run_test(
-            "Subway L line",
-            "https://streeteasy.com/for-rent/brooklyn/subway:L",
-            "https://streeteasy.com/for-rent/brooklyn/subway:L",
-        )
-        run_test(
-            "Subway case insensitive",
-            "https://streeteasy.com/for-rent/brooklyn/subway:L",
-            "https://streeteasy.com/for-rent/brooklyn/subway:l",
-        )
-        run_test(
-            "Multiple subway lines",
-            "https://streeteasy.com/for-rent/manhattan/subway:1|subway:2|subway:3",
-            "https://streeteasy.com/for-rent/manhattan/subway:3|subway:1|subway:2",
-        )
-
+        ("🚇 14. Subway / Transit", [
+            (
+                "Subway L line",
+                "https://streeteasy.com/for-rent/brooklyn/subway:L",
+                "https://streeteasy.com/for-rent/brooklyn/subway:L",
+                True,
+            ),
+            (
+                "Subway case insensitive",
+                "https://streeteasy.com/for-rent/brooklyn/subway:L",
+                "https://streeteasy.com/for-rent/brooklyn/subway:l",
+                True,
+            ),
+            (
+                "Multiple subway lines",
+                "https://streeteasy.com/for-rent/manhattan/subway:1|subway:2|subway:3",
+                "https://streeteasy.com/for-rent/manhattan/subway:3|subway:1|subway:2",
+                True,
+            ),
+            (
+                "Repeated subway line: L,L == L",
+                "https://streeteasy.com/for-rent/brooklyn/subway:L",
+                "https://streeteasy.com/for-rent/brooklyn/subway:L,L",
+                True,
+            ),
+        ]),
         # ================================================================
         # 15. FILTER ORDER INDEPENDENCE
         # ================================================================
-        print("\n🔄 15. Filter Order Independence")
-        print("-" * 40)
-
-        run_test(
-            "Same filters different order (2 filters)",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-|beds:2",
-            "https://streeteasy.com/for-sale/manhattan/beds:2|price:500000-",
-        )
-        run_test(
-            "Same filters different order (3 filters)",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-|beds:2|type:D1",
-            "https://streeteasy.com/for-sale/manhattan/type:D1|price:500000-|beds:2",
-        )
-        run_test(
-            "Complex order independence (5 filters)",
-            "https://streeteasy.com/for-rent/brooklyn/price:2000-3500|beds:2|no_fee:1|amenities:doorman|amenities:elevator",
-            "https://streeteasy.com/for-rent/brooklyn/amenities:elevator|beds:2|amenities:doorman|price:2000-3500|no_fee:1",
-        )
-
+        ("🔄 15. Filter Order Independence", [
+            (
+                "Same filters different order (2 filters)",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-|beds:2",
+                "https://streeteasy.com/for-sale/manhattan/beds:2|price:500000-",
+                True,
+            ),
+            (
+                "Same filters different order (3 filters)",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-|beds:2|type:D1",
+                "https://streeteasy.com/for-sale/manhattan/type:D1|price:500000-|beds:2",
+                True,
+            ),
+            (
+                "Complex order independence (5 filters)",
+                "https://streeteasy.com/for-rent/brooklyn/price:2000-3500|beds:2|no_fee:1|amenities:doorman|amenities:elevator",
+                "https://streeteasy.com/for-rent/brooklyn/amenities:elevator|beds:2|amenities:doorman|price:2000-3500|no_fee:1",
+                True,
+            ),
+        ]),
         # ================================================================
         # 16. CASE INSENSITIVITY
         # ================================================================
-        print("\n🔤 16. Case Insensitivity")
-        print("-" * 40)
-
-        run_test(
-            "Lowercase vs mixed case location",
-            "https://streeteasy.com/for-sale/manhattan",
-            "https://streeteasy.com/for-sale/Manhattan",
-        )
-        run_test(
-            "Uppercase filter key",
-            "https://streeteasy.com/for-sale/manhattan/beds:2",
-            "https://streeteasy.com/for-sale/manhattan/BEDS:2",
-        )
-
+        ("🔤 16. Case Insensitivity", [
+            (
+                "Lowercase vs mixed case location",
+                "https://streeteasy.com/for-sale/manhattan",
+                "https://streeteasy.com/for-sale/Manhattan",
+                True,
+            ),
+            (
+                "Uppercase filter key",
+                "https://streeteasy.com/for-sale/manhattan/beds:2",
+                "https://streeteasy.com/for-sale/manhattan/BEDS:2",
+                True,
+            ),
+        ]),
         # ================================================================
         # 17. DOMAIN & PROTOCOL VARIATIONS
         # ================================================================
-        print("\n🌐 17. Domain & Protocol Variations")
-        print("-" * 40)
-
-        run_test(
-            "http vs https",
-            "https://streeteasy.com/for-sale/manhattan",
-            "http://streeteasy.com/for-sale/manhattan",
-        )
-        run_test(
-            "www vs no-www",
-            "https://streeteasy.com/for-sale/manhattan",
-            "https://www.streeteasy.com/for-sale/manhattan",
-        )
-        run_test(
-            "No protocol",
-            "https://streeteasy.com/for-sale/manhattan",
-            "streeteasy.com/for-sale/manhattan",
-        )
-
+        ("🌐 17. Domain & Protocol Variations", [
+            (
+                "http vs https",
+                "https://streeteasy.com/for-sale/manhattan",
+                "http://streeteasy.com/for-sale/manhattan",
+                True,
+            ),
+            (
+                "www vs no-www",
+                "https://streeteasy.com/for-sale/manhattan",
+                "https://www.streeteasy.com/for-sale/manhattan",
+                True,
+            ),
+            (
+                "No protocol",
+                "https://streeteasy.com/for-sale/manhattan",
+                "streeteasy.com/for-sale/manhattan",
+                True,
+            ),
+        ]),
         # ================================================================
         # 18. SORT PARAMETER IGNORED
         # ================================================================
-        print("\n📋 18. Sort Parameter (Ignored)")
-        print("-" * 40)
-
-        run_test(
-            "Sort param ignored (Chrome-verified: ?sort_by=se_score)",
-            "https://streeteasy.com/for-sale/manhattan/beds:2",
-            "https://streeteasy.com/for-sale/manhattan/beds:2?sort_by=se_score",
-        )
-        run_test(
-            "Different sort params still match",
-            "https://streeteasy.com/for-sale/manhattan/beds:2?sort_by=price_asc",
-            "https://streeteasy.com/for-sale/manhattan/beds:2?sort_by=price_desc",
-        )
-
+        ("📋 18. Sort Parameter (Ignored)", [
+            (
+                "Sort param ignored (Chrome-verified: ?sort_by=se_score)",
+                "https://streeteasy.com/for-sale/manhattan/beds:2",
+                "https://streeteasy.com/for-sale/manhattan/beds:2?sort_by=se_score",
+                True,
+            ),
+            (
+                "Different sort params still match",
+                "https://streeteasy.com/for-sale/manhattan/beds:2?sort_by=price_asc",
+                "https://streeteasy.com/for-sale/manhattan/beds:2?sort_by=price_desc",
+                True,
+            ),
+        ]),
         # ================================================================
         # 19. COMPLEX MULTI-FILTER — REAL CHROME URLs
         # ================================================================
-        print("\n🎯 19. Complex Multi-Filter (Chrome-Verified URLs)")
-        print("-" * 40)
-
-        run_test(
-            "Chrome URL #1: type + price + beds (Chrome-verified)",
-            "https://streeteasy.com/for-sale/manhattan/type:D1|price:500000-700000|beds:2?sort_by=se_score",
-            "https://streeteasy.com/for-sale/manhattan/beds:2|type:D1|price:500000-700000?sort_by=se_score",
-        )
-        run_test(
-            "Chrome URL #2: type + price + beds + pets (Chrome-verified)",
-            "https://streeteasy.com/for-sale/manhattan/type:D1|price:500000-700000|beds:2|pets:allowed?sort_by=se_score",
-            "https://streeteasy.com/for-sale/manhattan/pets:allowed|beds:2|type:D1|price:500000-700000?sort_by=se_score",
-        )
-        run_test(
-            "Chrome URL #3: all filters (Chrome-verified)",
-            "https://streeteasy.com/for-sale/manhattan/type:D1|price:500000-700000|beds:2|amenities:doorman|pets:allowed?sort_by=se_score",
-            "https://streeteasy.com/for-sale/manhattan/amenities:doorman|pets:allowed|beds:2|price:500000-700000|type:D1?sort_by=se_score",
-        )
-        run_test(
-            "Missing filter should NOT match",
-            "https://streeteasy.com/for-sale/manhattan/type:D1|price:500000-|beds:2",
-            "https://streeteasy.com/for-sale/manhattan/price:500000-|beds:2",
-            expected_match=False,
-        )
-
+        ("🎯 19. Complex Multi-Filter (Chrome-Verified URLs)", [
+            (
+                "Chrome URL #1: type + price + beds (Chrome-verified)",
+                "https://streeteasy.com/for-sale/manhattan/type:D1|price:500000-700000|beds:2?sort_by=se_score",
+                "https://streeteasy.com/for-sale/manhattan/beds:2|type:D1|price:500000-700000?sort_by=se_score",
+                True,
+            ),
+            (
+                "Chrome URL #2: type + price + beds + pets (Chrome-verified)",
+                "https://streeteasy.com/for-sale/manhattan/type:D1|price:500000-700000|beds:2|pets:allowed?sort_by=se_score",
+                "https://streeteasy.com/for-sale/manhattan/pets:allowed|beds:2|type:D1|price:500000-700000?sort_by=se_score",
+                True,
+            ),
+            (
+                "Chrome URL #3: all filters (Chrome-verified)",
+                "https://streeteasy.com/for-sale/manhattan/type:D1|price:500000-700000|beds:2|amenities:doorman|pets:allowed?sort_by=se_score",
+                "https://streeteasy.com/for-sale/manhattan/amenities:doorman|pets:allowed|beds:2|price:500000-700000|type:D1?sort_by=se_score",
+                True,
+            ),
+            (
+                "Missing filter should NOT match",
+                "https://streeteasy.com/for-sale/manhattan/type:D1|price:500000-|beds:2",
+                "https://streeteasy.com/for-sale/manhattan/price:500000-|beds:2",
+                False,
+            ),
+        ]),
         # ================================================================
         # 20. NEIGHBORHOOD + FILTERS
         # ================================================================
-        print("\n🏘️  20. Neighborhood + Filters")
-        print("-" * 40)
+        ("🏘️  20. Neighborhood + Filters", [
+            (
+                "Neighborhood with filters",
+                "https://streeteasy.com/for-sale/manhattan/upper-west-side/type:D1|price:500000-",
+                "https://streeteasy.com/for-sale/manhattan/upper-west-side/type:D1|price:500000-",
+                True,
+            ),
+            (
+                "Neighborhood filter order",
+                "https://streeteasy.com/for-sale/manhattan/upper-west-side/type:D1|price:500000-",
+                "https://streeteasy.com/for-sale/manhattan/upper-west-side/price:500000-|type:D1",
+                True,
+            ),
+            (
+                "Different neighborhood should NOT match",
+                "https://streeteasy.com/for-sale/manhattan/upper-west-side/type:D1",
+                "https://streeteasy.com/for-sale/manhattan/upper-east-side/type:D1",
+                False,
+            ),
+        ]),
+    ]
+
+    def run_comprehensive_tests():
+        """Run all edge case tests."""
+        total_tests = 0
+        passed_tests = 0
 
-        run_test(
-            "Neighborhood with filters",
-            "https://streeteasy.com/for-sale/manhattan/upper-west-side/type:D1|price:500000-",
-            "https://streeteasy.com/for-sale/manhattan/upper-west-side/type:D1|price:500000-",
-        )
-        run_test(
-            "Neighborhood filter order",
-            "https://streeteasy.com/for-sale/manhattan/upper-west-side/type:D1|price:500000-",
-            "https://streeteasy.com/for-sale/manhattan/upper-west-side/price:500000-|type:D1",
-        )
-        run_test(
-            "Different neighborhood should NOT match",
-            "https://streeteasy.com/for-sale/manhattan/upper-west-side/type:D1",
-            "https://streeteasy.com/for-sale/manhattan/upper-east-side/type:D1",
-            expected_match=False,
-        )
+        # Many tests share a GT URL; build each evaluator (and its GT parse) once
+        get_evaluator = functools.lru_cache(maxsize=256)(lambda u: StreetEasyUrlMatch(gt_url=u))
+
+        # Identical (agent, gt) pairs recur across sections; the cached
+        # (match, details) results are shared, so treat details as read-only
+        @functools.lru_cache(maxsize=1024)
+        def match_cached(agent_url, gt_url):
+            return get_evaluator(gt_url)._urls_match(agent_url, gt_url)
+
+        def run_test(name, gt_url, agent_url, expected_match=True):
+            """Run one case and return its report line."""
+            nonlocal total_tests, passed_tests
+            total_tests += 1
+            match, details = match_cached(agent_url, gt_url)
+            status = "✅" if match == expected_match else "❌"
+            if match == expected_match:
+                passed_tests += 1
+            else:
+                # Only failures look at the diagnostics
+                mismatches = details["mismatches"]
+                extra = ""
+                if mismatches:
+                    extra = f" — {mismatches}"
+                return f"  {status} {name}{extra}"
+            return f"  {status} {name}"
+
+        # Buffer each section's report and write it in one call
+        for title, cases in EDGE_CASE_SECTIONS:
+            lines = [f"\n{title}", "-" * 40]
+            for name, gt_url, agent_url, expected_match in cases:
+                lines.append(run_test(name, gt_url, agent_url, expected_match))
+            sys.stdout.write("\n".join(lines) + "\n")
 
         # ================================================================
         # RESULTS SUMMARY
@@ -1378,4 +1507,4 @@ if __name__ == "__main__":
 
         return passed_tests == total_tests
 
-    asyncio.run(run_comprehensive_tests())
+    run_comprehensive_tests()
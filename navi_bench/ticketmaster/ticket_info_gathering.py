@@ -4,11 +4,9 @@ This module provides functionality to verify AI agent ticket search results on T
 by gathering event information through JavaScript scraping and matching against expected queries.
 """
 
-import functools
+import asyncio
 import itertools
-import random
-import re
-from datetime import datetime, timedelta
+import weakref
 from pathlib import Path
 from typing import Literal
 
@@ -21,6 +19,24 @@ from navi_bench.base import BaseMetric, BaseTaskConfig, UserMetadata, get_import
 from navi_bench.dates import initialize_user_metadata
 
 
+# The JS scraper is read once per process and shared by every verifier
+_JS_SCRIPT = (Path(__file__).parent / "ticket_info_gathering.js").read_text()
+
+# Searches the page markup in the browser and returns two flags, so update()
+# doesn't pull the whole serialized DOM over CDP on every navigation
+_ANTI_BOT_PROBE_JS = """() => {
+    const html = document.documentElement ? document.documentElement.outerHTML : "";
+    return {
+        queue: html.includes("You are now in line"),
+        blocked: html.includes("Pardon the Interruption") || html.includes("sec-text-container"),
+    };
+}"""
+
+# SPA navigations arrive in bursts (redirects, replaceState); a page's worker
+# waits this long after a navigation and scrapes once for the whole burst
+_NAV_DEBOUNCE_S = 0.3
+
+
 class SingleCandidateQuery(TypedDict, total=False):
     """Single event query with specific criteria."""
     event_name: str | None
@@ -117,60 +133,130 @@ class FinalResult(BaseModel):
     is_query_covered: list[bool]
 
 
+# InfoDict fields the query checks read; two scrapes that agree on all of
+# them are the same evidence
+_INFO_SIGNATURE_KEYS = (
+    "eventName", "date", "venue", "city", "price", "ticketCount",
+    "isResale", "availabilityStatus", "section", "row",
+)
+
+
+def _infos_signature(infos: list[InfoDict]) -> tuple:
+    """Content key for a scraped infos list."""
+    return tuple(tuple(info.get(k) for k in _INFO_SIGNATURE_KEYS) for info in infos)
+
+
+# Text query fields matched by case-insensitive substring
+_TEXT_QUERY_KEYS = ("event_names", "venues", "cities")
+
+
+def _lowered_terms(query: MultiCandidateQuery) -> dict[str, tuple[str, ...]]:
+    """Lowercase a query's text terms once, so matching needn't redo it per info."""
+    return {key: tuple(term.lower() for term in query.get(key) or ()) for key in _TEXT_QUERY_KEYS}
+
+
 class TicketmasterInfoGathering(BaseMetric):
     """Gather event ticket information from Ticketmaster to evaluate query coverage."""
 
     def __init__(self, queries: list[list[MultiCandidateQuery]]) -> None:
         super().__init__()
         self.queries = queries
+        self._lowered_queries = [
+            [_lowered_terms(q) for q in alternative_conditions] for alternative_conditions in queries
+        ]
         self._all_infos: list[list[InfoDict]] = []
         self._is_query_covered: list[bool] = [False] * len(queries)
-        self._unavailable_evidences: list[list[list[InfoDict]]] = [
-            [[] for _ in alternative_conditions] for alternative_conditions in queries
-        ]
+        self._n_covered = 0
+        # Unavailable evidence is stored flat; (query, alternative) -> indices
+        # into _evidences, created only for alternatives that gather any
+        self._evidences: list[InfoDict] = []
+        self._evidence_indices: dict[tuple[int, int], list[int]] = {}
         self._navigation_stack: list[dict] = [] 
-        self._tracked_pages: set = set()
+        # (base_url, page_type) -> position in _navigation_stack
+        self._nav_index: dict[tuple[str, str], int] = {}
+        # Stack positions of blocked pages, unblocked event listings and
+        # unblocked category/search pages
+        self._blocked_idxs: set[int] = set()
+        self._listing_idxs: set[int] = set()
+        self._fallback_idxs: set[int] = set()
+        # Keyed by the page itself (weakly): a closed page's id() can be
+        # reused by a new one, which must not inherit its entries
+        self._tracked_pages: weakref.WeakSet[Page] = weakref.WeakSet()
+        self._seen_info_signatures: set[tuple] = set()
+        # page -> pending-navigation queue (size 1) and the worker draining it
+        self._nav_queues: weakref.WeakKeyDictionary[Page, asyncio.Queue] = weakref.WeakKeyDictionary()
+        self._nav_workers: weakref.WeakKeyDictionary[Page, asyncio.Task] = weakref.WeakKeyDictionary()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(queries={self.queries})"
 
-    @functools.cached_property
+    @property
     def js_script(self) -> str:
-        """Load the JavaScript scraper."""
-        with open(Path(__file__).parent / "ticket_info_gathering.js", "r") as f:
-            return f.read()
+        """The JavaScript scraper."""
+        return _JS_SCRIPT
 
     async def reset(self) -> None:
         self._all_infos = []
         self._is_query_covered = [False] * len(self.queries)
-        self._unavailable_evidences = [[[] for _ in alternative_conditions] for alternative_conditions in self.queries]
+        self._n_covered = 0
+        self._evidences = []
+        self._evidence_indices = {}
         self._navigation_stack = []
-        self._tracked_pages = set()
+        self._nav_index = {}
+        self._blocked_idxs = set()
+        self._listing_idxs = set()
+        self._fallback_idxs = set()
+        self._tracked_pages = weakref.WeakSet()
+        self._seen_info_signatures = set()
+        # Workers outlive a reset (their listeners do too); just drop any
+        # navigation they haven't picked up yet
+        for queue in self._nav_queues.values():
+            while not queue.empty():
+                queue.get_nowait()
     
     def attach_to_context(self, context) -> None:
         """Attach automatic navigation tracking to a browser context."""
-        import asyncio
-        
         async def track_page(page) -> None:
-            page_id = id(page)
-            if page_id in self._tracked_pages:
+            if page in self._tracked_pages:
                 return
-            self._tracked_pages.add(page_id)
+            self._tracked_pages.add(page)
             
-            async def on_frame_navigated(frame):
-                if frame != page.main_frame:
-                    return
-                try:
-                    logger.info(f"[NAV] TM: {page.url[:80]}...")
-                    await self.update(page=page)
-                except Exception as e:
-                    logger.warning(f"Update failed: {e}")
+            queue = self._nav_queues.get(page)
+            if queue is None:
+                queue = self._nav_queues[page] = asyncio.Queue(maxsize=1)
+
+                async def nav_worker():
+                    while True:
+                        await queue.get()
+                        await asyncio.sleep(_NAV_DEBOUNCE_S)
+                        # Navigations during the wait are covered by this scrape
+                        while not queue.empty():
+                            queue.get_nowait()
+                        try:
+                            logger.info(f"[NAV] TM: {page.url[:80]}...")
+                            await self.update(page=page)
+                        except Exception as e:
+                            logger.warning(f"Update failed: {e}")
+
+                worker = self._nav_workers[page] = asyncio.create_task(nav_worker())
+
+                def on_close(_):
+                    worker.cancel()
+                    self._nav_queues.pop(page, None)
+                    self._nav_workers.pop(page, None)
+                    self._tracked_pages.discard(page)
+
+                page.on("close", on_close)
             
-            page.on("framenavigated", lambda f: asyncio.create_task(on_frame_navigated(f)))
+            def on_frame_navigated(frame):
+                # A full queue already has a scrape pending for this page
+                if frame == page.main_frame and not queue.full():
+                    queue.put_nowait(None)
+            
+            page.on("framenavigated", on_frame_navigated)
             logger.info(f"Tracking attached to TM page: {page.url[:60]}...")
         
         for page in context.pages:
-            import asyncio
             asyncio.create_task(track_page(page))
         
         context.on("page", lambda p: asyncio.create_task(track_page(p)))
@@ -182,10 +268,10 @@ class TicketmasterInfoGathering(BaseMetric):
         url = page.url
         
         # 1. Check for Anti-Bot / Queue immediately to avoid useless timeouts
-        content = await page.content()
-        if "queue-it.net" in url or "You are now in line" in content:
+        probe = await page.evaluate(_ANTI_BOT_PROBE_JS)
+        if "queue-it.net" in url or probe["queue"]:
             logger.warning("Agent is currently in a Ticketmaster Queue.")
-        elif "Pardon the Interruption" in content or "sec-text-container" in content:
+        elif probe["blocked"]:
             logger.error("Agent has been blocked by Ticketmaster PerimeterX/DataDome.")
 
         # 2. Wait for TM specific elements
@@ -210,7 +296,7 @@ class TicketmasterInfoGathering(BaseMetric):
                 logger.info("No TM search grid found, proceeding anyway")
 
         # 3. RUN JS SCRAPER
-        infos: list[InfoDict] = await page.evaluate(self.js_script)
+        infos: list[InfoDict] = await page.evaluate(_JS_SCRIPT)
         
         # =====================================================================
         # DEBUG: SCRAPING STAGE BREAKDOWN
@@ -248,15 +334,24 @@ class TicketmasterInfoGathering(BaseMetric):
         # =====================================================================
 
         # 4. Filter and Stack logic
+        self._record_page(url, infos)
+
+    def _record_page(self, url: str, infos: list[InfoDict]) -> None:
+        """Push a scraped page onto the navigation stack (replacing a revisit in place)."""
         page_type = infos[0].get("pageType", "unknown") if infos else "unknown"
         anti_bot = infos[0].get("antiBotStatus", "unknown") if infos else "unknown"
 
         logger.info(f"Ticketmaster Gathering -> Type: {page_type} | AntiBot: {anti_bot} | Infos: {len(infos)}")
-        self._all_infos.append(infos)
+        # Revisited pages (back/forward, filter toggles) often rescrape the
+        # exact same offers; keep one copy of each distinct payload
+        signature = _infos_signature(infos)
+        if signature not in self._seen_info_signatures:
+            self._seen_info_signatures.add(signature)
+            self._all_infos.append(infos)
         
         base_url = url.split("?")[0]
-        existing_idx = next((i for i, e in enumerate(self._navigation_stack) 
-                           if e["base_url"] == base_url and e["page_type"] == page_type), None)
+        nav_key = (base_url, page_type)
+        idx = self._nav_index.get(nav_key)
         
         page_entry = {
             "url": url,
@@ -264,64 +359,67 @@ class TicketmasterInfoGathering(BaseMetric):
             "page_type": page_type,
             "anti_bot": anti_bot,
             "infos": infos,
+            "signature": signature,
         }
         
-        if existing_idx is not None:
-            self._navigation_stack[existing_idx] = page_entry
+        if idx is not None:
+            self._navigation_stack[idx] = page_entry
         else:
+            idx = self._nav_index[nav_key] = len(self._navigation_stack)
             self._navigation_stack.append(page_entry)
 
-    async def compute(self) -> FinalResult:
-        """Compute final coverage score by walking backwards through navigation stack."""
-        event_listing_found = False
-        fallback_infos: list[InfoDict] = []
-        
-        # Walk backwards
-        for page_visit in reversed(self._navigation_stack):
-            page_type = page_visit["page_type"]
-            anti_bot = page_visit["anti_bot"]
-            page_infos = page_visit["infos"]
+        # Keep the stack partitioned by what compute() does with each entry
+        self._blocked_idxs.discard(idx)
+        self._listing_idxs.discard(idx)
+        self._fallback_idxs.discard(idx)
+        if anti_bot == "blocked_perimeterx":
+            self._blocked_idxs.add(idx)
+        elif page_type == "event_listing":
+            self._listing_idxs.add(idx)
+        elif page_type in ("event_category", "search_results"):
+            self._fallback_idxs.add(idx)
 
-            if anti_bot == "blocked_perimeterx":
+    async def compute(self) -> FinalResult:
+        """Compute final coverage score from the most recent usable pages.
+
+        The latest unblocked event listing decides coverage; without one, every
+        unblocked category/search page is used as fallback.
+        """
+        listing_idx = max(self._listing_idxs, default=-1)
+        for idx in self._blocked_idxs:
+            if idx > listing_idx:
                 logger.error("Cannot verify successful completion: Agent was blocked by PerimeterX.")
-                continue
-                
-            if page_type == "event_listing" and not event_listing_found:
-                event_listing_found = True
-                for i, alternative_conditions in enumerate(self.queries):
-                    if self._is_query_covered[i]:
-                        continue
-                    for info in page_infos:
-                        if self._check_alternative_conditions(i, alternative_conditions, info):
-                            self._is_query_covered[i] = True
-                            break
-                break
-            
-            elif page_type in ["event_category", "search_results"]:
-                fallback_infos.extend(page_infos)
-        
-        # Fallback for sold-out/discovery
-        if not event_listing_found and fallback_infos:
-            for i, alternative_conditions in enumerate(self.queries):
-                if self._is_query_covered[i]:
-                    continue
-                for info in fallback_infos:
-                    if self._check_alternative_conditions(i, alternative_conditions, info):
-                        self._is_query_covered[i] = True
-                        break
+
+        # Coverage persists across compute() calls, so skip straight to
+        # exhaustion once nothing is left to cover
+        if self._n_covered < len(self.queries):
+            if listing_idx >= 0:
+                self._cover_queries(self._navigation_stack[listing_idx]["infos"])
+            elif self._fallback_idxs:
+                # Fallback for sold-out/discovery, newest first; identical
+                # fallback pages add no new evidence
+                fallback_infos: list[InfoDict] = []
+                fallback_signatures: set[tuple] = set()
+                for idx in sorted(self._fallback_idxs, reverse=True):
+                    page_visit = self._navigation_stack[idx]
+                    if page_visit["signature"] not in fallback_signatures:
+                        fallback_signatures.add(page_visit["signature"])
+                        fallback_infos.extend(page_visit["infos"])
+                if fallback_infos:
+                    self._cover_queries(fallback_infos)
         
         # Handle exhaustion
         for i, alternative_conditions in enumerate(self.queries):
             if self._is_query_covered[i]:
                 continue
             for j, alternative_condition in enumerate(alternative_conditions):
-                if not self._is_exhausted(alternative_condition, self._unavailable_evidences[i][j]):
+                if not self._is_exhausted(alternative_condition, self._unavailable_evidences(i, j)):
                     break
             else:
-                self._is_query_covered[i] = True
+                self._mark_covered(i)
 
         n_queries = len(self.queries)
-        n_covered = sum(self._is_query_covered)
+        n_covered = self._n_covered
         return FinalResult(
             score=n_covered / max(n_queries, 1),
             n_queries=n_queries,
@@ -330,34 +428,69 @@ class TicketmasterInfoGathering(BaseMetric):
             is_query_covered=self._is_query_covered,
         )
 
-    def _check_alternative_conditions(
-        self, i: int, alternative_conditions: list[MultiCandidateQuery], info: InfoDict
-    ) -> bool:
-        for j, alternative_condition in enumerate(alternative_conditions):
-            evidences = self._unavailable_evidences[i][j]
-            if self._check_multi_candidate_query(alternative_condition, info, evidences):
-                return True
-        return False
+    def _mark_covered(self, i: int) -> None:
+        """Flip query i to covered, keeping _n_covered in step."""
+        if not self._is_query_covered[i]:
+            self._is_query_covered[i] = True
+            self._n_covered += 1
+
+    def _cover_queries(self, infos: list[InfoDict]) -> None:
+        """Mark every uncovered query that some alternative condition matches in infos.
+
+        Infos are indexed by date once, so a condition with dates only checks
+        infos on those dates. Any other info can neither cover the condition
+        nor count towards its exhaustion, which needs evidence on a queried date.
+        """
+        by_date: dict[str | None, list[InfoDict]] = {}
+        for info in infos:
+            by_date.setdefault(info.get("date"), []).append(info)
+
+        for i, alternative_conditions in enumerate(self.queries):
+            if self._is_query_covered[i]:
+                continue
+            for j, alternative_condition in enumerate(alternative_conditions):
+                if q_dates := alternative_condition.get("dates"):
+                    candidates = [info for d in dict.fromkeys(q_dates) for info in by_date.get(d, ())]
+                else:
+                    candidates = infos
+                found: list[InfoDict] = []
+                lowered = self._lowered_queries[i][j]
+                covered = any(
+                    self._check_multi_candidate_query(alternative_condition, info, found, lowered)
+                    for info in candidates
+                )
+                if found:
+                    start = len(self._evidences)
+                    self._evidences.extend(found)
+                    self._evidence_indices.setdefault((i, j), []).extend(range(start, len(self._evidences)))
+                if covered:
+                    self._mark_covered(i)
+                    break
+
+    def _unavailable_evidences(self, i: int, j: int) -> list[InfoDict]:
+        """Unavailable evidence gathered for alternative j of query i."""
+        return [self._evidences[k] for k in self._evidence_indices.get((i, j), ())]
 
     @classmethod
     def _check_multi_candidate_query(
-        cls, query: MultiCandidateQuery, info: InfoDict, evidences: list[InfoDict]
+        cls,
+        query: MultiCandidateQuery,
+        info: InfoDict,
+        evidences: list[InfoDict],
+        lowered: dict[str, tuple[str, ...]] | None = None,
     ) -> bool:
-        """Check TM-specific query constraints."""
-        
-        # Text based matches
-        if q_names := query.get("event_names"):
-            if not any(q.lower() in info.get("eventName", "").lower() for q in q_names):
-                return False
-
-        if q_venues := query.get("venues"):
-            if not any(q.lower() in info.get("venue", "").lower() for q in q_venues):
-                return False
+        """Check TM-specific query constraints.
 
-        if q_cities := query.get("cities"):
-            city = (info.get("city") or "").lower()
-            if not city or not any(c.lower() in city for c in q_cities):
-                return False
+        Pure predicates run cheapest first (flags, numbers, then text) so most
+        rejections skip the lowercasing; the availability gate stays last
+        since it records evidence.
+        """
+        # Ticketmaster specific resale logic
+        if query.get("require_resale") is True and not info.get("isResale", False):
+            return False
+            
+        if query.get("exclude_resale") is True and info.get("isResale", False):
+            return False
 
         # Numeric and Filter constraints
         if min_tickets := query.get("min_tickets"):
@@ -365,15 +498,27 @@ class TicketmasterInfoGathering(BaseMetric):
                 return False
 
         if max_price := query.get("max_price"):
-            if info.get("price") is not None and info.get("price") > max_price:
+            price = info.get("price")
+            if price is not None and price > max_price:
                 return False
 
-        # Ticketmaster specific resale logic
-        if query.get("require_resale") is True and not info.get("isResale", False):
-            return False
-            
-        if query.get("exclude_resale") is True and info.get("isResale", False):
-            return False
+        # Text based matches (info fields lowercased once, not per term)
+        if lowered is None:
+            lowered = _lowered_terms(query)
+        if q_names := lowered["event_names"]:
+            event_name = info.get("eventName", "").lower()
+            if not any(q in event_name for q in q_names):
+                return False
+
+        if q_venues := lowered["venues"]:
+            venue = info.get("venue", "").lower()
+            if not any(q in venue for q in q_venues):
+                return False
+
+        if q_cities := lowered["cities"]:
+            city = (info.get("city") or "").lower()
+            if not city or not any(c in city for c in q_cities):
+                return False
 
         # Availability logic
         require_available = query.get("require_available", False)
@@ -406,11 +551,34 @@ class TicketmasterInfoGathering(BaseMetric):
 
     @classmethod
     def _is_exhausted(cls, query: MultiCandidateQuery, evidences: list[InfoDict]) -> bool:
+        """Whether every (event name, date) choice has unavailable evidence.
+
+        Evidence is indexed once, so each choice is a set lookup; an empty name
+        or date in the query matches any evidence.
+        """
+        if not evidences:
+            return False
+        seen_pairs, seen_names, seen_dates = set(), set(), set()
+        for info in evidences:
+            name = info.get("eventName", "").lower()
+            date = info.get("date")
+            seen_pairs.add((name, date))
+            seen_names.add(name)
+            seen_dates.add(date)
+
         q_names = query.get("event_names") or [None]
         q_dates = query.get("dates") or [None]
 
         for q_name, q_date in itertools.product(q_names, q_dates):
-            if not any(cls._check_single_candidate_query({"event_name": q_name, "date": q_date}, info) for info in evidences):
+            if q_name and q_date:
+                found = (q_name.lower(), q_date) in seen_pairs
+            elif q_name:
+                found = q_name.lower() in seen_names
+            elif q_date:
+                found = q_date in seen_dates
+            else:
+                found = True
+            if not found:
                 return False
         return True
 
@@ -6,37 +6,70 @@ Allows manual testing of AI agent navigation tasks.
 
 Usage:
     python -m navi_bench.zillow.demo_zillow
+
+To skip Chromium's cold start between runs, keep one browser alive and
+point the demo at it over CDP:
+    python -m navi_bench.zillow.demo_zillow --serve-browser
+    ZILLOW_CDP_URL=http://localhost:9222 python -m navi_bench.zillow.demo_zillow
+
+To keep run-all results across crashes, append them to an NDJSON file; a
+rerun of either run-all mode skips scenarios already recorded there:
+    python -m navi_bench.zillow.demo_zillow --output results.ndjson
 """
 
+from __future__ import annotations
+
+import argparse
 import asyncio
+import functools
+import json
+import os
+import re
 import sys
-from dataclasses import dataclass
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from loguru import logger
 
+# Playwright takes ~100 ms to import; it is loaded on first browser use so the
+# menu comes up immediately
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from navi_bench.zillow.zillow_url_match import ZillowUrlMatch
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskScenario:
-    """A verification scenario for Zillow."""
+    """A verification scenario for Zillow.
+
+    The ground truth URL is parsed once, when the scenario is built, and
+    handed to each ZillowUrlMatch created for it.
+    """
     name: str
     prompt: str
     ground_truth_url: str
     category: str = "general"
+    # Run in a fresh context even when run-all reuses one across scenarios
+    requires_isolation: bool = False
+    parsed_gt: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "parsed_gt", ZillowUrlMatch.parse_url(self.ground_truth_url))
 
 
 # ============================================================================
 # PREDEFINED TEST SCENARIOS
 # ============================================================================
 
-SCENARIOS = [
+SCENARIOS = (
     TaskScenario(
         name="Basic Price Filter",
         prompt="Find homes for sale in Los Angeles, CA with a minimum price of $500,000",
@@ -97,6 +130,123 @@ SCENARIOS = [
         ground_truth_url='https://www.zillow.com/homes/for_sale/Beverly-Hills,-CA_rb/?searchQueryState={"filterState":{"price":{"min":5000000},"beds":{"min":5}}}',
         category="luxury"
     ),
+)
+
+
+# Every scenario starts from the home page
+ZILLOW_ORIGIN = "https://www.zillow.com"
+
+# The home page is ready for the task once its search box is on screen
+SEARCH_BOX_SELECTOR = 'input[placeholder*="Address"]'
+SEARCH_BOX_TIMEOUT_MS = 5000
+
+# Auto mode: a scenario finishes once the page reaches a Zillow search URL
+# that the verifier accepts (see _reaches_ground_truth). Zillow loads the
+# bare /homes/for_sale/<loc>_rb/ page before any filter is applied, so the
+# path alone is not enough. On timeout the current URL is verified as-is.
+AUTO_MODE_URL_RE = re.compile(r".*/homes/(for_sale|for_rent)/.*")
+AUTO_MODE_TIMEOUT_MS = 5 * 60 * 1000
+# Max scenarios (browser contexts) running at once in concurrent auto mode
+AUTO_MODE_CONCURRENCY = 3
+
+# One long-lived thread serves every blocking input(), so the event loop (and
+# the warm pool's idle timers) keeps running while the demo waits on the user
+_INPUT_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zillow-input")
+
+# When set, connect to this long-lived Chromium instead of launching one
+CDP_URL_ENV = "ZILLOW_CDP_URL"
+CDP_PORT = 9222
+
+# Warm pool: browsers handed back by BrowserManager.close() are kept for the
+# next menu selection instead of paying Playwright/Chromium startup again
+BROWSER_POOL_SIZE = 2
+BROWSER_IDLE_TIMEOUT_S = 120
+
+_PLAYWRIGHT = None
+_BROWSER_POOL: deque[Browser] = deque()
+_IDLE_TIMERS: dict[Browser, asyncio.TimerHandle] = {}
+# Close tasks started by idle eviction, held until done so they aren't collected
+_CLOSING: set[asyncio.Task] = set()
+
+
+async def _ainput(prompt: str) -> str:
+    """Read a line via input() on _INPUT_POOL without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_INPUT_POOL, input, prompt)
+
+
+async def _get_playwright():
+    """Start Playwright on first use and keep it for the life of the process."""
+    global _PLAYWRIGHT
+    if _PLAYWRIGHT is None:
+        from playwright.async_api import async_playwright
+        
+        _PLAYWRIGHT = await async_playwright().start()
+    return _PLAYWRIGHT
+
+
+def _take_pooled_browser() -> Optional[Browser]:
+    """Pop a still-connected browser from the warm pool, if any."""
+    while _BROWSER_POOL:
+        browser = _BROWSER_POOL.pop()
+        if timer := _IDLE_TIMERS.pop(browser, None):
+            timer.cancel()
+        if browser.is_connected():
+            return browser
+    return None
+
+
+def _evict_idle(browser: Browser) -> None:
+    """Close a pooled browser that has sat unused for BROWSER_IDLE_TIMEOUT_S."""
+    _IDLE_TIMERS.pop(browser, None)
+    try:
+        _BROWSER_POOL.remove(browser)
+    except ValueError:
+        return
+    task = asyncio.create_task(browser.close())
+    _CLOSING.add(task)
+    task.add_done_callback(_CLOSING.discard)
+
+
+async def _release_browser(browser: Browser) -> None:
+    """Return a browser to the warm pool, or close it if the pool is full."""
+    if not browser.is_connected():
+        return
+    if len(_BROWSER_POOL) >= BROWSER_POOL_SIZE:
+        await browser.close()
+        return
+    _BROWSER_POOL.append(browser)
+    _IDLE_TIMERS[browser] = asyncio.get_running_loop().call_later(
+        BROWSER_IDLE_TIMEOUT_S, _evict_idle, browser
+    )
+
+
+async def shutdown_browser_pool() -> None:
+    """Close every pooled browser and stop Playwright."""
+    global _PLAYWRIGHT
+    while browser := _take_pooled_browser():
+        await browser.close()
+    # Let evictions already in flight finish before Playwright goes away
+    await asyncio.gather(*_CLOSING, return_exceptions=True)
+    if _PLAYWRIGHT is not None:
+        await _PLAYWRIGHT.stop()
+        _PLAYWRIGHT = None
+
+
+# Chromium launch flag presets, picked by BrowserConfig.stealth
+STEALTH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+]
+# Skips startup work (extensions, background fetches, unused features) that
+# URL-only verification never needs
+FAST_ARGS = [
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-features=Translate,BackForwardCache,MediaRouter",
+    "--mute-audio",
 ]
 
 
@@ -107,14 +257,21 @@ class BrowserConfig:
     viewport_height: int = 800
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
     locale: str = "en-US"
-    launch_args: list = None
+    # Inject the anti-detection init script into every page. Verification
+    # only reads page.url, so it is off by default; turn it on if Zillow
+    # starts serving CAPTCHAs.
+    stealth: bool = False
+    # Overrides the STEALTH_ARGS / FAST_ARGS preset when set
+    launch_args: Optional[list] = None
     
-    def __init__(self):
-        self.launch_args = [
-            "--disable-blink-features=AutomationControlled",
-            "--disable-dev-shm-usage",
-            "--no-sandbox",
-        ]
+    def get_launch_args(self) -> list:
+        """Chromium flags for this config, resolved at launch time."""
+        if self.launch_args is not None:
+            return list(self.launch_args)
+        args = list(STEALTH_ARGS if self.stealth else FAST_ARGS)
+        if self.headless:
+            args.append("--disable-gpu")
+        return args
 
 
 class BrowserManager:
@@ -122,20 +279,40 @@ class BrowserManager:
     
     def __init__(self, config: Optional[BrowserConfig] = None):
         self.config = config or BrowserConfig()
-        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._contexts: list[BrowserContext] = []
+        self._reusable: Optional[tuple[BrowserContext, Page]] = None
     
     async def launch(self) -> Page:
         """Launch browser and return page."""
-        self.playwright = await async_playwright().start()
-        
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.config.headless,
-            args=self.config.launch_args,
-        )
+        await self.launch_browser()
+        _, page = await self.new_session()
+        return page
+    
+    async def launch_browser(self) -> Browser:
+        """Get a browser once; sessions are opened with new_session().
+
+        Reuses a warm browser from the pool when one is available. Otherwise
+        launches Chromium, or connects to ZILLOW_CDP_URL if that is set.
+        """
+        if browser := _take_pooled_browser():
+            self.browser = browser
+            return self.browser
         
+        playwright = await _get_playwright()
+        if cdp_url := os.environ.get(CDP_URL_ENV):
+            self.browser = await playwright.chromium.connect_over_cdp(cdp_url)
+        else:
+            self.browser = await playwright.chromium.launch(
+                headless=self.config.headless,
+                args=self.config.get_launch_args(),
+            )
+        return self.browser
+    
+    async def new_session(self) -> tuple[BrowserContext, Page]:
+        """Open a fresh, isolated context and page on the running browser."""
         self.context = await self.browser.new_context(
             viewport={
                 "width": self.config.viewport_width,
@@ -144,27 +321,57 @@ class BrowserManager:
             user_agent=self.config.user_agent,
             locale=self.config.locale,
         )
+        self._contexts.append(self.context)
         
         # Anti-detection scripts
-        await self.context.add_init_script("""
-            // Hide webdriver property
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            // Override chrome.runtime
-            window.chrome = { runtime: {} };
-        """)
+        if self.config.stealth:
+            await self.context.add_init_script("""
+                // Hide webdriver property
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                });
+                
+                // Override chrome.runtime
+                window.chrome = { runtime: {} };
+            """)
         
         self.page = await self.context.new_page()
-        return self.page
+        return self.context, self.page
+    
+    async def reuse_session(self) -> tuple[BrowserContext, Page]:
+        """Return the manager's long-lived session, reset, opening it on first use.
+
+        Resetting clears cookies and Zillow's localStorage/sessionStorage, then
+        parks the page on about:blank, which is cheaper than a new context for
+        scenarios that only differ by URL. Storage of other origins is shared.
+        """
+        if self._reusable is None or self._reusable[1].is_closed():
+            self._reusable = await self.new_session()
+        else:
+            context, page = self._reusable
+            await context.clear_cookies()
+            # Zillow keeps search state in web storage, which survives cookie
+            # clearing; storage is only reachable from a page on its origin
+            if not page.url.startswith(ZILLOW_ORIGIN + "/"):
+                await page.goto(ZILLOW_ORIGIN + "/robots.txt")
+            await page.evaluate("localStorage.clear(); sessionStorage.clear()")
+            await page.goto("about:blank")
+        return self._reusable
     
     async def close(self):
-        """Close browser."""
+        """Close this manager's contexts and hand the browser back to the warm pool."""
+        self._reusable = None
+        for context in self._contexts:
+            await context.close()
+        self._contexts.clear()
         if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+            await _release_browser(self.browser)
+            self.browser = None
+
+
+def _trunc(s: str, n: int = 80) -> str:
+    """Cut s to n characters, marking the cut with an ellipsis."""
+    return s if len(s) <= n else s[:n] + "..."
 
 
 class ResultReporter:
@@ -172,35 +379,91 @@ class ResultReporter:
     
     @staticmethod
     def print_result(scenario: TaskScenario, result):
-        """Print detailed result."""
-        print("\n" + "=" * 70)
-        print("VERIFICATION RESULT")
-        print("=" * 70)
-        
-        print(f"\n📋 Scenario: {scenario.name}")
-        print(f"📝 Prompt: {scenario.prompt}")
-        print(f"🏷️  Category: {scenario.category}")
-        
-        print(f"\n🔗 Ground Truth URL:")
-        print(f"   {scenario.ground_truth_url[:80]}...")
-        
-        print(f"\n🌐 Agent URL:")
-        print(f"   {result.agent_url[:80]}..." if len(result.agent_url) > 80 else f"   {result.agent_url}")
+        """Print detailed result with a single write to stdout."""
+        parts: list[str] = [
+            "\n" + "=" * 70,
+            "VERIFICATION RESULT",
+            "=" * 70,
+            f"\n📋 Scenario: {scenario.name}",
+            f"📝 Prompt: {scenario.prompt}",
+            f"🏷️  Category: {scenario.category}",
+            "\n🔗 Ground Truth URL:",
+            f"   {_trunc(scenario.ground_truth_url)}",
+            "\n🌐 Agent URL:",
+            f"   {_trunc(result.agent_url)}",
+        ]
         
         if result.match:
-            print(f"\n✅ RESULT: PASS (Score: {result.score})")
+            parts.append(f"\n✅ RESULT: PASS (Score: {result.score})")
         else:
-            print(f"\n❌ RESULT: FAIL (Score: {result.score})")
+            parts.append(f"\n❌ RESULT: FAIL (Score: {result.score})")
             
             if result.details.get("mismatches"):
-                print("\n📊 Mismatches:")
-                for mismatch in result.details["mismatches"]:
-                    print(f"   - {mismatch}")
+                parts.append("\n📊 Mismatches:")
+                parts.extend(f"   - {mismatch}" for mismatch in result.details["mismatches"])
         
         if result.details.get("extra_filters"):
-            print(f"\nℹ️  Extra filters (allowed): {result.details['extra_filters']}")
+            parts.append(f"\nℹ️  Extra filters (allowed): {result.details['extra_filters']}")
         
-        print("\n" + "=" * 70)
+        parts.append("\n" + "=" * 70)
+        sys.stdout.write("\n".join(parts) + "\n")
+
+
+class ResultLog:
+    """Append-only NDJSON log of run-all results, one line per result."""
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.completed: set[str] = set()
+        ends_with_newline = True
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for lineno, line in enumerate(f, 1):
+                    ends_with_newline = line.endswith("\n")
+                    if not line.strip():
+                        continue
+                    # A crash can leave a half-written last line behind
+                    try:
+                        self.completed.add(json.loads(line)["scenario"])
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        logger.warning("Skipping unreadable line {} in {}", lineno, self.path)
+        # Line-buffered, so every result is on disk as soon as it is written
+        self._file = self.path.open("a", buffering=1, encoding="utf-8")
+        if not ends_with_newline:
+            # Don't glue the next record onto a truncated one
+            self._file.write("\n")
+    
+    def write(self, scenario: TaskScenario, result) -> None:
+        """Record one result."""
+        self._file.write(json.dumps({
+            "scenario": scenario.name,
+            "score": result.score,
+            "match": result.match,
+            "agent_url": result.agent_url,
+            "ts": time.time(),
+        }) + "\n")
+        self.completed.add(scenario.name)
+    
+    def close(self) -> None:
+        """Close the log file."""
+        self._file.close()
+
+
+# Set from --output; the run-all modes record their results here and skip
+# scenarios already in it. Single and custom runs are never recorded.
+_RESULT_LOG: Optional[ResultLog] = None
+
+
+def _pending_indices(
+    scenarios: tuple[TaskScenario, ...], result_log: Optional[ResultLog]
+) -> list[int]:
+    """Indices of scenarios that result_log has not recorded yet."""
+    if result_log is None:
+        return list(range(len(scenarios)))
+    pending = [i for i, s in enumerate(scenarios) if s.name not in result_log.completed]
+    if skipped := len(scenarios) - len(pending):
+        print(f"⏭️  Skipping {skipped} scenario(s) already in {result_log.path}")
+    return pending
 
 
 def show_menu():
@@ -212,80 +475,243 @@ def show_menu():
     
     for i, scenario in enumerate(SCENARIOS, 1):
         print(f"  {i:2}. [{scenario.category.upper():12}] {scenario.name}")
-        print(f"      └─ {scenario.prompt[:60]}...")
+        print(f"      └─ {_trunc(scenario.prompt, 60)}")
     
     print(f"\n  {len(SCENARIOS)+1:2}. Run all scenarios automatically")
     print(f"  {len(SCENARIOS)+2:2}. Enter custom ground truth URL")
+    print(f"  {len(SCENARIOS)+3:2}. Run all scenarios concurrently (auto mode)")
     print("   0. Exit")
     
     print("\n" + "-" * 70)
 
 
-async def run_scenario(scenario: TaskScenario, auto_mode: bool = False):
-    """Run a single verification scenario."""
+@dataclass
+class ScenarioBatch:
+    """Per-scenario verifiers for the run-all modes.
+
+    Built once and reused across runs; run_scenario resets each verifier
+    instead of constructing a new one.
+    """
+    scenarios: tuple[TaskScenario, ...]
+    verifiers: list[ZillowUrlMatch] = field(init=False)
+    
+    def __post_init__(self):
+        self.verifiers = [
+            ZillowUrlMatch(s.ground_truth_url, parsed_ground_truth=s.parsed_gt)
+            for s in self.scenarios
+        ]
+
+
+_RUN_ALL_BATCH: Optional[ScenarioBatch] = None
+
+
+def _get_run_all_batch() -> ScenarioBatch:
+    """The ScenarioBatch for SCENARIOS, built on first use."""
+    global _RUN_ALL_BATCH
+    if _RUN_ALL_BATCH is None:
+        _RUN_ALL_BATCH = ScenarioBatch(SCENARIOS)
+    return _RUN_ALL_BATCH
+
+
+def _reaches_ground_truth(matcher: ZillowUrlMatch, url: str) -> bool:
+    """Auto-mode finish line: a search URL whose filters match the ground truth."""
+    if AUTO_MODE_URL_RE.match(url) is None:
+        return False
+    return matcher.matches(url)
+
+
+async def collect_final_url(
+    scenario: TaskScenario,
+    auto_mode: bool = False,
+    browser_mgr: Optional[BrowserManager] = None,
+    reuse_session: bool = False,
+) -> str:
+    """Browser half of a scenario: open Zillow, wait for the task, return the final URL.
+
+    With a shared browser_mgr whose browser is already running, the scenario
+    gets its own context on it and closes only that context. With
+    reuse_session it runs in the manager's long-lived session instead, unless
+    the scenario requires isolation.
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    
     print(f"\n🚀 Starting scenario: {scenario.name}")
     print(f"📝 Task: {scenario.prompt}")
     print("-" * 50)
     
-    # Initialize verifier
-    verifier = ZillowUrlMatch(scenario.ground_truth_url)
-    
-    # Launch browser
-    browser_mgr = BrowserManager()
-    page = await browser_mgr.launch()
+    # Launch browser, or open a session on the shared one
+    shared = browser_mgr is not None
+    reused = shared and reuse_session and not scenario.requires_isolation
+    if reused:
+        context, page = await browser_mgr.reuse_session()
+    elif shared:
+        context, page = await browser_mgr.new_session()
+    else:
+        browser_mgr = BrowserManager()
+        page = await browser_mgr.launch()
     
     # Navigate to Zillow
     print("\n🌐 Opening Zillow.com...")
-    await page.goto("https://www.zillow.com")
-    await page.wait_for_timeout(2000)
-    
-    # Track URL changes
-    urls_visited = []
-    
-    def on_navigation(frame):
-        if frame == page.main_frame:
-            urls_visited.append(page.url)
-            print(f"   📍 URL: {page.url[:60]}...")
-    
-    page.on("framenavigated", on_navigation)
+    await page.goto(ZILLOW_ORIGIN, wait_until="domcontentloaded")
+    try:
+        await page.wait_for_selector(SEARCH_BOX_SELECTOR, timeout=SEARCH_BOX_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        # e.g. a bot-check interstitial; the user can still navigate from here
+        logger.warning("Zillow search box did not appear within {} ms", SEARCH_BOX_TIMEOUT_MS)
     
     print("\n" + "=" * 50)
     print("MANUAL TASK")
     print("=" * 50)
     print(f"\n🎯 Your task: {scenario.prompt}")
     print("\nNavigate to Zillow and apply the required filters.")
-    print("The browser will track your URL changes.")
+    print("The final URL is verified when you are done.")
     
-    # Wait for user
-    await asyncio.to_thread(
-        input,
-        "\n⏸️  Press ENTER when you've completed the task... "
-    )
+    # Only the final URL is verified, so intermediate navigations are not tracked
+    if auto_mode:
+        # No prompt to wait on; the scenario is done once the filtered search
+        # URL loads (framenavigated also fires for Zillow's pushState updates)
+        matcher = ZillowUrlMatch(scenario.ground_truth_url, parsed_ground_truth=scenario.parsed_gt)
+        try:
+            async with page.expect_event(
+                "framenavigated",
+                predicate=lambda frame: (
+                    frame == page.main_frame and _reaches_ground_truth(matcher, frame.url)
+                ),
+                timeout=AUTO_MODE_TIMEOUT_MS,
+            ):
+                pass
+        except PlaywrightTimeoutError:
+            logger.warning("{}: no matching search URL within {} ms", scenario.name, AUTO_MODE_TIMEOUT_MS)
+    else:
+        # Wait for user
+        await _ainput("\n⏸️  Press ENTER when you've completed the task... ")
     
     # Get final URL
     final_url = page.url
     
-    # Verify
+    # Close browser (or just this scenario's context when shared; a reused
+    # session stays open for the next scenario)
+    if not shared:
+        await browser_mgr.close()
+    elif not reused:
+        await context.close()
+    
+    return final_url
+
+
+async def verify_url(
+    scenario: TaskScenario,
+    final_url: str,
+    verifier: Optional[ZillowUrlMatch] = None,
+    result_log: Optional[ResultLog] = None,
+    report: bool = True,
+):
+    """Verification half of a scenario: compare final_url, then log and report.
+
+    A preallocated verifier (see ScenarioBatch) is reset and reused. The
+    result is appended to result_log when one is given; with report=False
+    the caller prints it with ResultReporter later.
+    """
+    if verifier is None:
+        verifier = ZillowUrlMatch(scenario.ground_truth_url, parsed_ground_truth=scenario.parsed_gt)
+    else:
+        await verifier.reset()
+    
     await verifier.update(url=final_url)
     result = await verifier.compute()
     
-    # Close browser
-    await browser_mgr.close()
-    
-    # Report
-    ResultReporter.print_result(scenario, result)
+    if result_log is not None:
+        result_log.write(scenario, result)
+    if report:
+        ResultReporter.print_result(scenario, result)
     
     return result
 
 
+async def run_scenario(
+    scenario: TaskScenario,
+    auto_mode: bool = False,
+    browser_mgr: Optional[BrowserManager] = None,
+    reuse_session: bool = False,
+    verifier: Optional[ZillowUrlMatch] = None,
+    result_log: Optional[ResultLog] = None,
+):
+    """Run a single verification scenario (see collect_final_url and verify_url)."""
+    final_url = await collect_final_url(scenario, auto_mode, browser_mgr, reuse_session)
+    return await verify_url(scenario, final_url, verifier, result_log)
+
+
+async def run_all() -> None:
+    """Run every scenario in turn on one browser and one reused context."""
+    print("\n🔄 Running all scenarios...")
+    batch = _get_run_all_batch()
+    pending = _pending_indices(batch.scenarios, _RESULT_LOG)
+    if not pending:
+        return
+    browser_mgr = BrowserManager()
+    await browser_mgr.launch_browser()
+    try:
+        for i in pending:
+            await run_scenario(
+                batch.scenarios[i],
+                browser_mgr=browser_mgr,
+                reuse_session=True,
+                verifier=batch.verifiers[i],
+                result_log=_RESULT_LOG,
+            )
+    finally:
+        await browser_mgr.close()
+
+
+async def run_all_concurrently(concurrency: int = AUTO_MODE_CONCURRENCY) -> list:
+    """Run every scenario in auto mode, in parallel contexts on one browser.
+
+    Each scenario is verified and logged as soon as its final URL arrives, so
+    a crash mid-run keeps everything finished so far; the reports are
+    printed together at the end.
+    """
+    print(f"\n🔄 Running all scenarios concurrently ({concurrency} at a time)...")
+    batch = _get_run_all_batch()
+    pending = _pending_indices(batch.scenarios, _RESULT_LOG)
+    if not pending:
+        return []
+    browser_mgr = BrowserManager()
+    await browser_mgr.launch_browser()
+    sem = asyncio.Semaphore(concurrency)
+    
+    async def run_one(i: int):
+        async with sem:
+            final_url = await collect_final_url(
+                batch.scenarios[i], auto_mode=True, browser_mgr=browser_mgr
+            )
+        # The browser slot is free again; verifying is CPU-only
+        return await verify_url(
+            batch.scenarios[i], final_url, batch.verifiers[i], _RESULT_LOG, report=False
+        )
+    
+    try:
+        results = await asyncio.gather(
+            *(run_one(i) for i in pending), return_exceptions=True
+        )
+    finally:
+        await browser_mgr.close()
+    
+    for i, result in zip(pending, results):
+        if isinstance(result, BaseException):
+            print(f"❌ {batch.scenarios[i].name}: {type(result).__name__}: {result}")
+        else:
+            ResultReporter.print_result(batch.scenarios[i], result)
+    return results
+
+
 async def run_custom():
     """Run with custom ground truth URL."""
     print("\n" + "=" * 50)
     print("CUSTOM SCENARIO")
     print("=" * 50)
     
-    gt_url = input("\n🔗 Enter ground truth URL: ").strip()
-    prompt = input("📝 Enter task description: ").strip()
+    gt_url = (await _ainput("\n🔗 Enter ground truth URL: ")).strip()
+    prompt = (await _ainput("📝 Enter task description: ")).strip()
     
     scenario = TaskScenario(
         name="Custom Scenario",
@@ -297,30 +723,65 @@ async def run_custom():
     return await run_scenario(scenario)
 
 
-async def main():
+async def serve_browser(port: int = CDP_PORT) -> None:
+    """Keep a Chromium running with remote debugging for ZILLOW_CDP_URL clients."""
+    from playwright.async_api import async_playwright
+    
+    config = BrowserConfig()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=config.headless,
+            args=[*config.get_launch_args(), f"--remote-debugging-port={port}"],
+        )
+        print(f"Chromium listening; run the demo with {CDP_URL_ENV}=http://localhost:{port}")
+        print("Press Ctrl+C to stop.")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await browser.close()
+
+
+async def main(output: Optional[str] = None):
     """Main entry point."""
+    global _RESULT_LOG
+    if output:
+        _RESULT_LOG = ResultLog(output)
+    try:
+        await _menu_loop()
+    finally:
+        await shutdown_browser_pool()
+        if _RESULT_LOG is not None:
+            _RESULT_LOG.close()
+            _RESULT_LOG = None
+
+
+async def _invalid_choice() -> None:
+    """Menu action for numbers with no entry."""
+    print("❌ Invalid choice")
+
+
+async def _menu_loop():
+    """Show the menu and run selections until the user exits."""
+    n = len(SCENARIOS)
+    actions: dict[int, Callable[[], Awaitable]] = {
+        i: functools.partial(run_scenario, scenario)
+        for i, scenario in enumerate(SCENARIOS, 1)
+    }
+    actions[n + 1] = run_all
+    actions[n + 2] = run_custom
+    actions[n + 3] = run_all_concurrently
+    
     while True:
         show_menu()
         
         try:
-            choice = input("\n👉 Select scenario (0 to exit): ").strip()
+            choice = (await _ainput("\n👉 Select scenario (0 to exit): ")).strip()
             
             if choice == "0":
                 print("\n👋 Goodbye!")
                 break
             
-            choice_num = int(choice)
-            
-            if 1 <= choice_num <= len(SCENARIOS):
-                await run_scenario(SCENARIOS[choice_num - 1])
-            elif choice_num == len(SCENARIOS) + 1:
-                print("\n🔄 Running all scenarios...")
-                for scenario in SCENARIOS:
-                    await run_scenario(scenario)
-            elif choice_num == len(SCENARIOS) + 2:
-                await run_custom()
-            else:
-                print("❌ Invalid choice")
+            await actions.get(int(choice), _invalid_choice)()
         
         except ValueError:
             print("❌ Please enter a number")
@@ -329,5 +790,33 @@ async def main():
             break
 
 
+def _install_uvloop() -> None:
+    """Use uvloop for the event loop when it is installed (it has no Windows build)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Zillow URL verifier demo")
+    parser.add_argument(
+        "--serve-browser", action="store_true",
+        help=f"keep a Chromium running for {CDP_URL_ENV} clients and exit on Ctrl+C",
+    )
+    parser.add_argument(
+        "--output", metavar="PATH", help="append run-all results to this NDJSON file"
+    )
+    args = parser.parse_args()
+    _install_uvloop()
+    
+    if args.serve_browser:
+        try:
+            asyncio.run(serve_browser())
+        except KeyboardInterrupt:
+            pass
+    else:
+        asyncio.run(main(output=args.output))
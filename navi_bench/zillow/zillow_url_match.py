@@ -8,11 +8,13 @@ Author: NaviBench Team
 Version: 1.0.0
 """
 
+import functools
 import json
 import re
+import sys
 from datetime import datetime
 from typing import Any, Optional
-from urllib.parse import parse_qs, unquote, urlparse
+from urllib.parse import unquote, uses_params
 from zoneinfo import ZoneInfo
 
 from beartype import beartype
@@ -21,6 +23,89 @@ from pydantic import BaseModel
 
 from navi_bench.base import BaseMetric, BaseTaskConfig, UserMetadata, get_import_path
 
+# orjson decodes searchQueryState faster when installed; it is not a
+# dependency, so fall back to the stdlib parser. orjson is stricter than
+# json.loads: it rejects NaN, Infinity and out-of-range floats, and turns
+# integers wider than 64 bits into floats. Those payloads go to json.loads
+# (see _parse_search_query_state) so results match the stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_SCHEME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+-.")
+
+# A run of 19+ digits may be an integer orjson can't hold exactly
+_WIDE_INT_RE = re.compile(r'\d{19}')
+
+# First non-empty searchQueryState value in a query string (parse_qs skips blanks)
+_SQS_RE = re.compile(r'(?:^|&)searchQueryState=([^&]+)')
+
+
+def _split_url(url: str) -> tuple[str, str, str]:
+    """
+    Split a stripped URL into (hostname, path, query) the way ``urlparse``
+    does (lowercased hostname, "" if absent; path without ``;params``),
+    without building a ParseResult.
+    """
+    if "\t" in url or "\r" in url or "\n" in url:
+        url = url.replace("\t", "").replace("\r", "").replace("\n", "")
+    url = url.partition("#")[0]
+    
+    scheme = ""
+    i = url.find(":")
+    if i > 0 and url[0].isascii() and url[0].isalpha() and _SCHEME_CHARS.issuperset(url[:i]):
+        scheme = url[:i].lower()
+        url = url[i + 1:]
+    
+    hostname = ""
+    if url[:2] == "//":
+        end = len(url)
+        for c in "/?":
+            pos = url.find(c, 2)
+            if pos >= 0:
+                end = min(end, pos)
+        netloc, url = url[2:end], url[end:]
+        hostinfo = netloc.rpartition("@")[2]
+        _, bracket, bracketed = hostinfo.partition("[")
+        if bracket:
+            hostname = bracketed.partition("]")[0]
+        else:
+            hostname = hostinfo.partition(":")[0]
+        # As in urlparse, an IPv6 zone ID after "%" keeps its case
+        host, pct, zone = hostname.partition("%")
+        hostname = host.lower() + pct + zone
+    
+    path, _, query = url.partition("?")
+    if scheme in uses_params and ";" in path:
+        i = path.find(";", max(path.rfind("/"), 0))
+        if i >= 0:
+            path = path[:i]
+    return hostname, path, query
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_search_query_state(raw: str) -> Any:
+    """
+    Decode a raw ``searchQueryState`` query value (form-decoded as
+    ``parse_qs`` would, then unquoted again for double-encoded URLs), cached
+    across verifier instances and retries. The result is shared; callers
+    must not mutate it.
+    """
+    state_json = raw.replace("+", " ")
+    # Each unquote is skipped when there is nothing left to decode
+    if "%" in state_json:
+        state_json = unquote(state_json)
+        if "%" in state_json:
+            state_json = unquote(state_json)
+    if orjson is not None and _WIDE_INT_RE.search(state_json) is None:
+        try:
+            return orjson.loads(state_json)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(state_json)
+
 
 class ZillowVerifierResult(BaseModel):
     """Result of Zillow URL verification."""
@@ -53,7 +138,7 @@ class ZillowUrlMatch(BaseMetric):
     """
     
     # Parameters to ignore during comparison (UI state, not search filters)
-    IGNORED_PARAMS = {
+    IGNORED_PARAMS = frozenset({
         "pagination",
         "mapBounds", 
         "isMapVisible",
@@ -62,7 +147,7 @@ class ZillowUrlMatch(BaseMetric):
         "customRegionId",
         "sort",     # Auto-set default sort, not user-intent
         "fr",       # for-rent flag (context only)
-    }
+    })
     
     # Mapping of abbreviated property type keys → canonical key.
     # Zillow uses BOTH forms depending on context:
@@ -80,25 +165,27 @@ class ZillowUrlMatch(BaseMetric):
     }
 
     # All 7 canonical property types
-    ALL_PROPERTY_TYPES = {
+    ALL_PROPERTY_TYPES = frozenset({
         "ishouse", "istownhouse", "ismultifamily", "iscondo",
         "islotland", "isapartment", "ismanufactured",
-    }
+    })
     
     # Primary listing status types (for-sale context).
     # Zillow uses negative encoding: selecting e.g. "New Construction"
     # disables all OTHER primary statuses (fsba:F, fsbo:F, fore:F, auc:F).
     # The 5 primary types that participate in negative encoding:
-    ALL_LISTING_TYPES = {"fsba", "fsbo", "nc", "fore", "auc"}
+    ALL_LISTING_TYPES = frozenset({"fsba", "fsbo", "nc", "fore", "auc"})
     
     # Valid Zillow domains
-    VALID_DOMAINS = {"zillow.com", "www.zillow.com"}
+    VALID_DOMAINS = frozenset({"zillow.com", "www.zillow.com"})
     
     # URL path patterns that indicate non-search / error pages
-    INVALID_PATH_PATTERNS = {
+    INVALID_PATH_PATTERNS = frozenset({
         "/error", "/captcha", "/404", "/login", "/register",
         "/user/", "/myzillow", "/profile",
-    }
+    })
+    # All of INVALID_PATH_PATTERNS as one substring search
+    _INVALID_PATH_RE = re.compile("|".join(map(re.escape, sorted(INVALID_PATH_PATTERNS))))
     
     # Search type patterns in URL path
     SEARCH_TYPES = {
@@ -106,6 +193,18 @@ class ZillowUrlMatch(BaseMetric):
         "for_rent": ["/homes/for_rent/", "for_rent", "/rentals/", "/apartments-for-rent/"],
         "recently_sold": ["/homes/recently_sold/", "recently_sold", "/sold/"],
     }
+    # One compiled substring search per search type, in SEARCH_TYPES order
+    _SEARCH_TYPE_RES = tuple(
+        (search_type, re.compile("|".join(map(re.escape, patterns))))
+        for search_type, patterns in SEARCH_TYPES.items()
+    )
+    
+    # Location segment of the URL path
+    # Pattern: /homes/for_sale/Los-Angeles-CA_rb/ or /los-angeles-ca/
+    LOCATION_PATH_RE = re.compile(
+        r'/(?:homes/(?:for_sale|for_rent|recently_sold)/)?([^/]+?)(?:_rb)?/?(?:\?|$)',
+        re.IGNORECASE,
+    )
     
     def __init__(
         self,
@@ -114,6 +213,7 @@ class ZillowUrlMatch(BaseMetric):
         strict_location: bool = True,
         ignore_map_bounds: bool = True,
         ignore_pagination: bool = True,
+        parsed_ground_truth: Optional[dict] = None,
     ):
         """
         Initialize the Zillow URL verifier.
@@ -123,6 +223,8 @@ class ZillowUrlMatch(BaseMetric):
             strict_location: If True, requires exact location match.
             ignore_map_bounds: If True, ignores mapBounds differences.
             ignore_pagination: If True, ignores pagination differences.
+            parsed_ground_truth: ``parse_url(ground_truth_url)`` if the
+                caller already has it; skips re-parsing the ground truth.
         """
         self.ground_truth_url = ground_truth_url
         self.strict_location = strict_location
@@ -130,12 +232,32 @@ class ZillowUrlMatch(BaseMetric):
         self.ignore_pagination = ignore_pagination
         
         self._agent_url: Optional[str] = None
-        self._parsed_gt = self._parse_zillow_url(ground_truth_url)
+        if parsed_ground_truth is None:
+            parsed_ground_truth = self._parse_zillow_url(ground_truth_url)
+        self._parsed_gt = parsed_ground_truth
+        self._gt_keys = frozenset(parsed_ground_truth["filters"])
     
     async def reset(self) -> None:
         """Reset the verifier state."""
         self._agent_url = None
 
+    @classmethod
+    def parse_url(cls, url: str) -> dict:
+        """
+        Parse a Zillow URL into the normalized components the verifier compares.
+        
+        No verifier is built. A ground truth parsed this way can be passed back
+        as ``parsed_ground_truth``.
+        """
+        return cls._parse_zillow_url(url)
+
+    def matches(self, url: str) -> bool:
+        """Check whether url describes the ground truth search.
+        
+        Unlike update()/compute(), this leaves the verifier's state alone.
+        """
+        return self._urls_match(url, self.ground_truth_url)[0]
+
     @staticmethod
     def _is_valid_zillow_url(url: str) -> bool:
         """Check if a URL is a valid Zillow search page.
@@ -146,14 +268,13 @@ class ZillowUrlMatch(BaseMetric):
         """
         if not url:
             return False
-        parsed = urlparse(url.strip())
-        domain = parsed.hostname or ""
+        domain, path, _ = _split_url(url.strip())
         # Must be from zillow.com
         if domain not in ZillowUrlMatch.VALID_DOMAINS:
             return False
         # Reject known non-search paths
-        path_lower = parsed.path.lower()
-        if any(p in path_lower for p in ZillowUrlMatch.INVALID_PATH_PATTERNS):
+        path_lower = path.lower()
+        if ZillowUrlMatch._INVALID_PATH_RE.search(path_lower):
             return False
         return True
 
@@ -200,7 +321,8 @@ class ZillowUrlMatch(BaseMetric):
             details=details
         )
     
-    def _parse_zillow_url(self, url: str) -> dict:
+    @classmethod
+    def _parse_zillow_url(cls, url: str) -> dict:
         """
         Parse a Zillow URL into normalized components.
         
@@ -230,43 +352,37 @@ class ZillowUrlMatch(BaseMetric):
         url = url.strip()
         
         # Parse URL
-        parsed = urlparse(url)
+        domain, path, query = _split_url(url)
         
         # Validate domain
-        domain = parsed.hostname or ""
-        if domain and domain not in self.VALID_DOMAINS:
+        if domain and domain not in cls.VALID_DOMAINS:
             logger.warning(f"Invalid Zillow domain: {domain}")
             return result
         
-        path = parsed.path.lower()
+        path = path.lower()
         
         # Detect search type from path
-        for search_type, patterns in self.SEARCH_TYPES.items():
-            if any(p in path for p in patterns):
+        for search_type, pattern_re in cls._SEARCH_TYPE_RES:
+            if pattern_re.search(path):
                 result["search_type"] = search_type
                 break
         
         # Extract location from path
-        # Pattern: /homes/for_sale/Los-Angeles-CA_rb/ or /los-angeles-ca/
-        location_match = re.search(
-            r'/(?:homes/(?:for_sale|for_rent|recently_sold)/)?([^/]+?)(?:_rb)?/?(?:\?|$)',
-            path,
-            re.IGNORECASE
-        )
+        location_match = cls.LOCATION_PATH_RE.search(path)
         if location_match:
             location = location_match.group(1)
             # Clean up location string
             location = location.replace("-", " ").replace("_", " ")
-            location = unquote(location)
+            if "%" in location:
+                location = unquote(location)
             result["location"] = location.lower().strip()
         
         # Parse searchQueryState parameter
-        query_params = parse_qs(parsed.query)
+        sqs_match = _SQS_RE.search(query)
         
-        if "searchQueryState" in query_params:
+        if sqs_match:
             try:
-                state_json = unquote(query_params["searchQueryState"][0])
-                state = json.loads(state_json)
+                state = _parse_search_query_state(sqs_match.group(1))
                 
                 # Extract region info
                 if "regionSelection" in state and state["regionSelection"]:
@@ -280,7 +396,7 @@ class ZillowUrlMatch(BaseMetric):
                 
                 # Extract and normalize filter state
                 if "filterState" in state:
-                    result["filters"] = self._normalize_filter_state(state["filterState"])
+                    result["filters"] = cls._normalize_filter_state(state["filterState"])
                 
                 # Check for sort selection
                 if "sortSelection" in state:
@@ -293,7 +409,8 @@ class ZillowUrlMatch(BaseMetric):
         
         return result
     
-    def _normalize_filter_state(self, filter_state: dict) -> dict:
+    @classmethod
+    def _normalize_filter_state(cls, filter_state: dict) -> dict:
         """
         Normalize the filterState dictionary for comparison.
         
@@ -326,19 +443,24 @@ class ZillowUrlMatch(BaseMetric):
         false_listing_types: set[str] = set()
         true_listing_types: set[str] = set()
         
+        # Hot loop: bind class constants and bound methods once
+        abbrev_map = cls.ABBREV_TO_CANONICAL
+        prop_set = cls.ALL_PROPERTY_TYPES
+        list_set = cls.ALL_LISTING_TYPES
+        ignored = cls.IGNORED_PARAMS
+        norm_val = cls._normalize_value
+        intern = sys.intern
+        
         for key, value in filter_state.items():
             # Skip ignored parameters
-            if key in self.IGNORED_PARAMS:
+            if key in ignored:
                 continue
             
             # Normalize the key (lowercase)
-            norm_key = key.lower()
+            norm_key = intern(key.lower())
             
-            # Check if this is a property type abbreviation
-            is_abbrev = norm_key in self.ABBREV_TO_CANONICAL
-            is_canonical = norm_key in self.ALL_PROPERTY_TYPES
-            # Check if this is a listing status type
-            is_listing_type = norm_key in self.ALL_LISTING_TYPES
+            # Canonical key if this is a property type abbreviation, else None
+            canonical = abbrev_map.get(norm_key)
             
             # Handle different value formats
             if isinstance(value, dict):
@@ -347,40 +469,38 @@ class ZillowUrlMatch(BaseMetric):
                     val = value["value"]
                     if val is True:
                         # Map abbreviated keys to canonical form
-                        if is_abbrev:
-                            canonical = self.ABBREV_TO_CANONICAL[norm_key]
+                        if canonical is not None:
                             normalized[canonical] = True
                             true_types.add(canonical)
                         else:
                             normalized[norm_key] = True
-                            if is_canonical:
+                            if norm_key in prop_set:
                                 true_types.add(norm_key)
-                            if is_listing_type:
+                            elif norm_key in list_set:
                                 true_listing_types.add(norm_key)
                     elif val is False or val is None:
-                        # Track false property types for inference
-                        if is_abbrev:
+                        # Track false property / listing types for inference;
+                        # the false/null value itself is the default state
+                        if canonical is not None:
                             false_abbrevs.add(norm_key)
-                        # Track false listing types for inference
-                        if is_listing_type:
+                        elif norm_key in list_set:
                             false_listing_types.add(norm_key)
-                        # Skip false/null values (default state)
                     else:
                         # String or number values
-                        normalized[norm_key] = self._normalize_value(val)
+                        normalized[norm_key] = norm_val(val)
                     continue
                 
                 # Handle range filters {min: X, max: Y}
                 if "min" in value or "max" in value:
-                    if "min" in value and value["min"] is not None:
-                        normalized[f"{norm_key}_min"] = self._normalize_value(value["min"])
-                    if "max" in value and value["max"] is not None:
-                        normalized[f"{norm_key}_max"] = self._normalize_value(value["max"])
+                    if value.get("min") is not None:
+                        normalized[f"{norm_key}_min"] = norm_val(value["min"])
+                    if value.get("max") is not None:
+                        normalized[f"{norm_key}_max"] = norm_val(value["max"])
                     continue
                 
                 # Handle exact value
                 if "exact" in value:
-                    normalized[f"{norm_key}_exact"] = self._normalize_value(value["exact"])
+                    normalized[f"{norm_key}_exact"] = norm_val(value["exact"])
                     continue
                 
                 # Recursively process nested dicts (like homeType)
@@ -392,21 +512,20 @@ class ZillowUrlMatch(BaseMetric):
                     elif isinstance(sub_value, bool) and sub_value:
                         normalized[sub_norm_key] = True
                     elif sub_value not in (None, False, ""):
-                        normalized[sub_norm_key] = self._normalize_value(sub_value)
+                        normalized[sub_norm_key] = norm_val(sub_value)
             
             elif isinstance(value, bool):
                 if value:  # Only track True values
-                    if is_abbrev:
-                        canonical = self.ABBREV_TO_CANONICAL[norm_key]
+                    if canonical is not None:
                         normalized[canonical] = True
                         true_types.add(canonical)
                     else:
                         normalized[norm_key] = True
-                        if is_canonical:
+                        if norm_key in prop_set:
                             true_types.add(norm_key)
             
             elif value is not None and value != "":
-                normalized[norm_key] = self._normalize_value(value)
+                normalized[norm_key] = norm_val(value)
         
         # ---------------------------------------------------------------
         # Infer positive property types from negative-encoding pattern.
@@ -428,14 +547,11 @@ class ZillowUrlMatch(BaseMetric):
         # disable, then the selected types = ALL - disabled.
         # ---------------------------------------------------------------
         if false_abbrevs and not true_types:
-            disabled_types: set[str] = set()
-            for abbrev in false_abbrevs:
-                canonical = self.ABBREV_TO_CANONICAL.get(abbrev)
-                if canonical:
-                    disabled_types.add(canonical)
+            # Every tracked false abbrev is a key of abbrev_map
+            disabled_types = {abbrev_map[abbrev] for abbrev in false_abbrevs}
             
-            selected_types = self.ALL_PROPERTY_TYPES - disabled_types
-            if selected_types and len(selected_types) < len(self.ALL_PROPERTY_TYPES):
+            selected_types = prop_set - disabled_types
+            if selected_types and len(selected_types) < len(prop_set):
                 for ptype in selected_types:
                     normalized[ptype] = True
         
@@ -461,14 +577,15 @@ class ZillowUrlMatch(BaseMetric):
         # inferred set is empty → no listing types added. ✅
         # ---------------------------------------------------------------
         if false_listing_types and not true_listing_types:
-            selected_listings = self.ALL_LISTING_TYPES - false_listing_types
-            if selected_listings and len(selected_listings) < len(self.ALL_LISTING_TYPES):
+            selected_listings = list_set - false_listing_types
+            if selected_listings and len(selected_listings) < len(list_set):
                 for lt in selected_listings:
                     normalized[lt] = True
         
         return normalized
     
-    def _normalize_value(self, value: Any) -> Any:
+    @classmethod
+    def _normalize_value(cls, value: Any) -> Any:
         """
         Normalize a single filter value.
         
@@ -518,7 +635,13 @@ class ZillowUrlMatch(BaseMetric):
             Tuple of (match: bool, details: dict)
         """
         agent_parts = self._parse_zillow_url(agent_url)
-        gt_parts = self._parse_zillow_url(gt_url)
+        # The verifier's own ground truth is parsed once, in __init__
+        if gt_url == self.ground_truth_url:
+            gt_parts = self._parsed_gt
+            gt_keys = self._gt_keys
+        else:
+            gt_parts = self._parse_zillow_url(gt_url)
+            gt_keys = frozenset(gt_parts["filters"])
         
         details = {
             "agent_parsed": agent_parts,
@@ -556,8 +679,8 @@ class ZillowUrlMatch(BaseMetric):
         gt_filters = gt_parts["filters"]
         
         # Find missing, extra, and wrong filters
-        missing = set(gt_filters.keys()) - set(agent_filters.keys())
-        extra = set(agent_filters.keys()) - set(gt_filters.keys())
+        missing = gt_keys.difference(agent_filters)
+        extra = agent_filters.keys() - gt_keys
         wrong = {
             k for k in agent_filters 
             if k in gt_filters and agent_filters[k] != gt_filters[k]
@@ -668,6 +791,9 @@ def run_tests():
         {"name": "Max price only", "url": 'https://www.zillow.com/homes/for_sale/?searchQueryState={"filterState":{"price":{"max":1000000}}}', "expected_filters": {"price_max": 1000000}},
         {"name": "Price range", "url": 'https://www.zillow.com/homes/for_sale/?searchQueryState={"filterState":{"price":{"min":300000,"max":750000}}}', "expected_filters": {"price_min": 300000, "price_max": 750000}},
         {"name": "Monthly payment range", "url": 'https://www.zillow.com/homes/for_sale/?searchQueryState={"filterState":{"monthlyPayment":{"min":2000,"max":4000}}}', "expected_filters": {"monthlypayment_min": 2000, "monthlypayment_max": 4000}},
+        {"name": "NaN elsewhere keeps filterState", "url": 'https://www.zillow.com/homes/for_sale/?searchQueryState={"filterState":{"price":{"min":500000},"beds":{"min":NaN}}}', "expected_filters": {"price_min": 500000}},
+        {"name": "Out-of-range float max", "url": 'https://www.zillow.com/homes/for_sale/?searchQueryState={"filterState":{"price":{"min":500000,"max":1e999}}}', "expected_filters": {"price_min": 500000, "price_max": float("inf")}},
+        {"name": "Integer wider than 64 bits", "url": 'https://www.zillow.com/homes/for_sale/?searchQueryState={"filterState":{"price":{"max":123456789012345678901234567890}}}', "expected_filters": {"price_max": 123456789012345678901234567890}},
     ], test_results)
     
     # =========================================================================